@@ -0,0 +1,23 @@
+"""add quote deal/version index
+
+Revision ID: b1c2d3e4f5a6
+Revises: 9a2b3c4d5e6f
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b1c2d3e4f5a6"
+down_revision = "9a2b3c4d5e6f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_quote_deal_version", "quotes", ["deal_id", "version"])
+
+
+def downgrade():
+    op.drop_index("ix_quote_deal_version", table_name="quotes")
@@ -0,0 +1,27 @@
+"""add technopark report tenant/year/month index
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c2d3e4f5a6b7"
+down_revision = "b1c2d3e4f5a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_treport_tenant_year_month",
+        "technopark_reports",
+        ["tenant_id", "year", "month"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_treport_tenant_year_month", table_name="technopark_reports")
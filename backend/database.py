@@ -1,5 +1,6 @@
 import os
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -21,6 +22,13 @@ if DATABASE_URL.startswith("sqlite"):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself; pysqlite's implicit transactions would
+        # otherwise break SAVEPOINT handling (begin_nested)
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -37,4 +45,16 @@ def get_engine():
     """Return engine for Alembic migrations."""
     return engine
 
+def row_to_dict(row) -> dict:
+    """Column values of an ORM row as a plain dict (relationships are not included)."""
+    return {attr.key: getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs}
+
 
+def is_unique_violation(exc: IntegrityError, table: str, column: str) -> bool:
+    """True if exc is a unique constraint violation on table.column (SQLite or PostgreSQL)."""
+    orig = exc.orig
+    message = str(orig)
+    if getattr(orig, "pgcode", None) == "23505":
+        # PostgreSQL: 'duplicate key value ... DETAIL:  Key (email)=(...) already exists.'
+        return f"Key ({column})=" in message
+    return f"UNIQUE constraint failed: {table}.{column}" in message
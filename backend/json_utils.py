@@ -0,0 +1,36 @@
+"""
+JSON yardımcıları
+
+Ayar ve parametre blob'ları (Text kolonlarında saklanan JSON) için tek bir
+orjson tabanlı kodlayıcı/çözücü.
+"""
+
+import orjson
+from fastapi import Response
+
+JSONDecodeError = orjson.JSONDecodeError
+
+loads = orjson.loads
+
+
+def dumps(obj) -> str:
+    """Text kolonuna yazılacak JSON metni (int anahtarlar stdlib gibi string'e çevrilir)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def dumps_bytes(obj) -> bytes:
+    """HTTP yanıt gövdesi için JSON (UTC zaman damgaları 'Z' ile biter)"""
+    return orjson.dumps(obj, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+def rows_response(rows) -> Response:
+    """Kolon projeksiyonu satırlarını (Row) doğrudan JSON yanıtına çevir.
+
+    Satırlar zaten tipli DB kolonlarından gelir; Pydantic ile tekrar doğrulamak
+    yalnızca maliyettir. Endpoint'teki response_model OpenAPI dokümantasyonu
+    için kalır, yanıt gövdesini etkilemez.
+    """
+    return Response(
+        content=dumps_bytes([row._asdict() for row in rows]),
+        media_type="application/json",
+    )
@@ -3,6 +3,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from .database import engine, Base
 from .routers import accounts, products, sales, finance, projects, financial_accounts, contacts, activities, auth, reports, payroll
+from .services.pdf_pool import start_pdf_pool, shutdown_pdf_pool
 
 # NOTE: Database schema is managed by Alembic migrations.
 # Run 'alembic upgrade head' to apply migrations.
@@ -102,8 +103,14 @@ def health_check():
     return {"status": "healthy"}
 @app.on_event("startup")
 async def startup_event():
+    # Only the pool object; its (spawned) worker processes start on the first render
+    start_pdf_pool()
     print("Startup: Listing all routes:")
     for route in app.routes:
         if hasattr(route, "path"):
             print(f"Route: {route.path} [{route.methods}]")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    shutdown_pdf_pool()
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Enum, Text, Boolean, Date
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Enum, Text, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -297,6 +297,10 @@ class Quote(Base):
     parent_quote = relationship("Quote", remote_side=[id], backref="revisions")
     tenant = relationship("Tenant", back_populates="quotes")
 
+    __table_args__ = (
+        Index("ix_quote_deal_version", "deal_id", "version"),
+    )
+
 class QuoteItem(Base):
     """Teklif Kalemi"""
     __tablename__ = "quote_items"
@@ -727,6 +731,10 @@ class TechnoparkReport(Base):
         "TechnoparkReportLineItem", back_populates="report", cascade="all, delete-orphan"
     )
 
+    # list_reports filters by tenant and orders by year/month desc
+    __table_args__ = (
+        Index("ix_treport_tenant_year_month", "tenant_id", "year", "month"),
+    )
 
 class TechnoparkProjectEntry(Base):
     """Devam eden projeler listesi satırı"""
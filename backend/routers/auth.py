@@ -3,14 +3,16 @@ Authentication Router - JWT Based Authentication
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 from datetime import datetime, timedelta
 import hashlib
 import secrets
 import os
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, is_unique_violation
 
 router = APIRouter(
     prefix="/auth",
@@ -63,7 +65,8 @@ def get_current_user(
         del active_tokens[token]
         return None
     
-    user = db.query(models.User).filter(
+    # Tenant is read by most authenticated endpoints; fetch it in the same query
+    user = db.query(models.User).options(joinedload(models.User.tenant)).filter(
         models.User.email == token_data["email"]
     ).first()
     return user
@@ -87,23 +90,24 @@ def get_current_active_user(
 @router.post("/register", response_model=schemas.User)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Register new user"""
-    # Check if user exists
-    existing = db.query(models.User).filter(
-        models.User.email == user.email
-    ).first()
-    if existing:
+    # The unique email index rejects duplicates; no existence SELECT needed
+    try:
+        with db.begin_nested():
+            db_user = db.scalars(
+                insert(models.User).values(
+                    email=user.email,
+                    hashed_password=hash_password(user.password),
+                    full_name=user.full_name,
+                    is_active=True,
+                    is_superuser=False
+                ).returning(models.User)
+            ).one()
+    except IntegrityError as e:
+        if not is_unique_violation(e, "users", "email"):
+            raise
         raise HTTPException(status_code=400, detail="Email already registered")
-    
-    db_user = models.User(
-        email=user.email,
-        hashed_password=hash_password(user.password),
-        full_name=user.full_name,
-        is_active=True,
-        is_superuser=False
-    )
-    db.add(db_user)
+    db.expunge(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
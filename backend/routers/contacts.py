@@ -2,7 +2,7 @@
 Contacts Router - CRM İletişim Kişileri
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from .. import models, schemas
 from ..database import get_db
@@ -63,6 +63,16 @@ def read_contact(contact_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Contact not found")
     return db_contact
 
+# Everything the schemas.Quote list below serializes, loaded in bulk
+CONTACT_QUOTE_OPTIONS = (
+    selectinload(models.Quote.items).selectinload(models.QuoteItem.product),
+    selectinload(models.Quote.account),
+    selectinload(models.Quote.revisions).options(
+        selectinload(models.Quote.items).selectinload(models.QuoteItem.product),
+        selectinload(models.Quote.account),
+    ),
+)
+
 @router.get("/{contact_id}/quotes", response_model=List[schemas.Quote])
 def get_contact_quotes(contact_id: int, db: Session = Depends(get_db)):
     """Get all quotes associated with a contact"""
@@ -71,7 +81,7 @@ def get_contact_quotes(contact_id: int, db: Session = Depends(get_db)):
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
         
-    quotes = db.query(models.Quote).filter(
+    quotes = db.query(models.Quote).options(*CONTACT_QUOTE_OPTIONS).filter(
         models.Quote.contact_id == contact_id
     ).order_by(models.Quote.created_at.desc()).all()
     return quotes
@@ -10,20 +10,20 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("/", response_model=schemas.Customer)
-def create_customer(customer: schemas.CustomerCreate, db: Session = Depends(get_db)):
+@router.post("/", response_model=schemas.Account)
+def create_customer(customer: schemas.AccountCreate, db: Session = Depends(get_db)):
     db_customer = models.Customer(**customer.dict())
     db.add(db_customer)
     db.commit()
     db.refresh(db_customer)
     return db_customer
 
-@router.get("/", response_model=List[schemas.Customer])
+@router.get("/", response_model=List[schemas.Account])
 def read_customers(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     customers = db.query(models.Customer).offset(skip).limit(limit).all()
     return customers
 
-@router.get("/{customer_id}", response_model=schemas.Customer)
+@router.get("/{customer_id}", response_model=schemas.Account)
 def read_customer(customer_id: int, db: Session = Depends(get_db)):
     db_customer = db.query(models.Customer).filter(models.Customer.id == customer_id).first()
     if db_customer is None:
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func
 from typing import List
 from datetime import datetime
 from .. import models, schemas
+from .. import json_utils
 from ..database import get_db
 from ..services.invoice_parser import parse_invoice_pdf
 from ..services.invoice_service import update_stock, find_or_create_product
+from ..services.technopark_report_service import AUTOFILL_CACHE
 
 router = APIRouter(
     prefix="/finance",
@@ -14,6 +16,11 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# schemas.Transaction alanlarına karşılık gelen kolonlar (import sırasında bir kez çözülür)
+TRANSACTION_COLUMNS = tuple(
+    getattr(models.Transaction, name) for name in schemas.Transaction.model_fields
+)
+
 
 @router.post("/invoices/parse", response_model=schemas.ParsedInvoice)
 async def parse_uploaded_invoice(
@@ -44,6 +51,11 @@ async def parse_uploaded_invoice(
     
     try:
         result = await parse_invoice_pdf(file, invoice_type=invoice_type)
+        # Satır sözlükleri parser'da zaten tiplendirildi (str/float/int);
+        # satır başına doğrulama yapılmaz, hazır nesneler ParsedInvoice'a geçer
+        result["lines"] = [
+            schemas.ParsedInvoiceLine.model_construct(**line) for line in result["lines"]
+        ]
         return schemas.ParsedInvoice(**result)
     except Exception as e:
         raise HTTPException(
@@ -243,6 +255,7 @@ def create_invoice(invoice: schemas.InvoiceCreate, db: Session = Depends(get_db)
             project.spent_budget += db_invoice.total_amount
     
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     db.refresh(db_invoice)
     return db_invoice
 
@@ -448,6 +461,7 @@ def update_invoice(
 
     db.add(transaction)
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     db.refresh(invoice)
     return invoice
 
@@ -592,7 +606,7 @@ def read_invoices(
     db: Session = Depends(get_db)
 ):
     """Fatura listesi - Gelişmiş filtrelerle"""
-    query = db.query(models.Invoice)
+    query = db.query(models.Invoice).options(selectinload(models.Invoice.items))
     
     if invoice_type:
         query = query.filter(models.Invoice.invoice_type == invoice_type)
@@ -658,6 +672,7 @@ def delete_invoice(invoice_id: int, db: Session = Depends(get_db)):
     # Delete the invoice
     db.delete(invoice)
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     
     return {"message": "Fatura başarıyla silindi", "id": invoice_id}
 @router.post("/transactions", response_model=schemas.Transaction)
@@ -692,10 +707,11 @@ def create_transaction(transaction: schemas.TransactionCreate, db: Session = Dep
 
 @router.get("/transactions", response_model=List[schemas.Transaction])
 def read_transactions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    transactions = db.query(models.Transaction).order_by(
+    # Sadece schemas.Transaction kolonları
+    transactions = db.query(*TRANSACTION_COLUMNS).order_by(
         models.Transaction.date.desc()
     ).offset(skip).limit(limit).all()
-    return transactions
+    return json_utils.rows_response(transactions)
 
 @router.get("/dashboard", response_model=schemas.DashboardKPIs)
 def get_dashboard_kpis(db: Session = Depends(get_db)):
@@ -7,6 +7,7 @@ from .. import schemas, models
 from ..database import get_db
 from ..services.payroll_service import get_payroll_service
 from ..services.reporting_service import get_reporting_service
+from ..services.technopark_report_service import AUTOFILL_CACHE
 from .auth import get_current_active_user
 
 router = APIRouter(
@@ -33,7 +34,9 @@ def create_employee(
     current_user: models.User = Depends(get_current_active_user),
 ):
     service = get_payroll_service(db)
-    return service.create_employee(payload, current_user.tenant_id)
+    employee = service.create_employee(payload, current_user.tenant_id)
+    AUTOFILL_CACHE.invalidate()
+    return employee
 
 
 @router.put("/employees/{employee_id}", response_model=schemas.EmployeeResponse)
@@ -44,7 +47,9 @@ def update_employee(
     current_user: models.User = Depends(get_current_active_user),
 ):
     service = get_payroll_service(db)
-    return service.update_employee(employee_id, payload, current_user.tenant_id)
+    employee = service.update_employee(employee_id, payload, current_user.tenant_id)
+    AUTOFILL_CACHE.invalidate()
+    return employee
 
 
 @router.get("/periods", response_model=List[schemas.PayrollPeriodResponse])
@@ -63,7 +68,9 @@ def create_period(
     current_user: models.User = Depends(get_current_active_user),
 ):
     service = get_payroll_service(db)
-    return service.create_period(payload, current_user.tenant_id)
+    period = service.create_period(payload, current_user.tenant_id)
+    AUTOFILL_CACHE.invalidate()
+    return period
 
 
 @router.get("/periods/{period_id}/entries", response_model=List[schemas.PayrollEntryResponse])
@@ -84,7 +91,9 @@ def process_period(
     current_user: models.User = Depends(get_current_active_user),
 ):
     service = get_payroll_service(db)
-    return service.process_payroll_period(period_id, payload.entries, current_user.tenant_id)
+    entries = service.process_payroll_period(period_id, payload.entries, current_user.tenant_id)
+    AUTOFILL_CACHE.invalidate()
+    return entries
 
 
 @router.get("/periods/{period_id}/summary", response_model=schemas.PayrollSummaryResponse)
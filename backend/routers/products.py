@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
+from .. import json_utils
 from ..database import get_db
 from .auth import get_current_active_user
 
@@ -11,6 +12,9 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Columns schemas.Product exposes, resolved once at import
+PRODUCT_COLUMNS = tuple(getattr(models.Product, name) for name in schemas.Product.model_fields)
+
 @router.post("/", response_model=schemas.Product)
 def create_product(
     product: schemas.ProductCreate, 
@@ -35,10 +39,10 @@ def read_products(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
+    # Only the columns schemas.Product exposes, in the same shape
+    query = db.query(*PRODUCT_COLUMNS)
     # Filter products by tenant
-    query = db.query(models.Product)
     if current_user.tenant_id:
         query = query.filter(models.Product.tenant_id == current_user.tenant_id)
         
-    products = query.offset(skip).limit(limit).all()
-    return products
+    return json_utils.rows_response(query.offset(skip).limit(limit).all())
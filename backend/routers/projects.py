@@ -8,6 +8,7 @@ from typing import List
 from datetime import datetime
 from .. import models, schemas
 from ..database import get_db
+from ..services.technopark_report_service import AUTOFILL_CACHE
 
 router = APIRouter(
     prefix="/projects",
@@ -38,6 +39,7 @@ def create_project(project: schemas.ProjectCreate, request: Request, db: Session
     )
     db.add(db_project)
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     db.refresh(db_project)
     return db_project
 
@@ -95,6 +97,7 @@ def update_project(
         db_project.budget = project.budget
     
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     db.refresh(db_project)
     return db_project
 
@@ -110,6 +113,7 @@ def delete_project(project_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_project)
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     return {"message": "Project deleted"}
 
 
@@ -139,8 +143,9 @@ def get_project_summary(project_id: int, db: Session = Depends(get_db)):
         models.Invoice.project_id == project_id
     ).scalar() or 0
     
-    return schemas.ProjectSummary(
-        project=db_project,
+    # Totals come straight from SQL aggregates; only the ORM project needs converting
+    return schemas.ProjectSummary.model_construct(
+        project=schemas.Project.model_validate(db_project),
         total_income=total_income,
         total_expense=total_expense,
         profit=total_income - total_expense,
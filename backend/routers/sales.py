@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from datetime import datetime
 from .. import models, schemas
 from ..database import get_db
+from ..services.pdf_pool import run_in_pdf_pool
 
 router = APIRouter(
     prefix="/sales",
@@ -47,6 +50,48 @@ def generate_quote_number(db: Session) -> str:
     return quote_no
 
 
+def build_quote_items(quote_id: int, items) -> tuple:
+    """
+    Compute line totals for quote items in a single pass.
+    Returns (item mappings for bulk insert, subtotal, total_discount, total_vat).
+    """
+    rows = []
+    subtotal = 0.0
+    total_discount = 0.0
+    total_vat = 0.0
+
+    for item in items:
+        quantity = item.quantity
+        unit_price = item.unit_price
+        discount_percent = item.discount_percent
+        vat_rate = item.vat_rate
+
+        line_total = quantity * unit_price
+        discount = line_total * (discount_percent / 100)
+        discounted_total = line_total - discount
+        vat_amount = discounted_total * (vat_rate / 100)
+
+        subtotal += line_total
+        total_discount += discount
+        total_vat += vat_amount
+
+        rows.append({
+            "quote_id": quote_id,
+            "product_id": item.product_id,
+            "description": item.description,
+            "quantity": quantity,
+            "unit": getattr(item, 'unit', 'Adet'),
+            "unit_price": unit_price,
+            "discount_percent": discount_percent,
+            "vat_rate": vat_rate,
+            "line_total": line_total,
+            "vat_amount": vat_amount,
+            "total_with_vat": discounted_total + vat_amount,
+        })
+
+    return rows, subtotal, total_discount, total_vat
+
+
 # ==================== DEALS ====================
 
 @router.post("/deals", response_model=schemas.Deal)
@@ -106,13 +151,18 @@ def update_deal(deal_id: int, deal: schemas.DealUpdate, db: Session = Depends(ge
 @router.patch("/deals/{deal_id}/status", response_model=schemas.Deal)
 def update_deal_status(deal_id: int, status_update: schemas.DealStatusUpdate, db: Session = Depends(get_db)):
     """Fırsat durumunu güncelle"""
-    db_deal = db.query(models.Deal).filter(models.Deal.id == deal_id).first()
+    db_deal = db.scalars(
+        update(models.Deal)
+        .where(models.Deal.id == deal_id)
+        .values(status=status_update.status)
+        .returning(models.Deal)
+    ).first()
     if not db_deal:
         raise HTTPException(status_code=404, detail="Deal not found")
     
-    db_deal.status = status_update.status
+    # Detach so the commit doesn't expire the row RETURNING already loaded
+    db.expunge(db_deal)
     db.commit()
-    db.refresh(db_deal)
     return db_deal
 
 @router.delete("/deals/{deal_id}")
@@ -136,18 +186,14 @@ def convert_deal_to_quote(deal_id: int, quote_data: schemas.QuoteFromDeal, db: S
     
     try:
         # Check existing quotes for versioning
-        existing_quotes = db.query(models.Quote).filter(models.Quote.deal_id == deal_id).count()
-        version = existing_quotes + 1
+        version = db.query(func.coalesce(func.max(models.Quote.version), 0)).filter(
+            models.Quote.deal_id == deal_id
+        ).scalar() + 1
         
         # Generate quote number
         base_quote_no = generate_quote_number(db)
         quote_no = f"{base_quote_no}-V{version}" if version > 1 else base_quote_no
         
-        # Calculate totals
-        subtotal = 0.0
-        total_vat = 0.0
-        total_discount = 0.0
-        
         db_quote = models.Quote(
             quote_no=quote_no,
             deal_id=deal_id,
@@ -162,31 +208,8 @@ def convert_deal_to_quote(deal_id: int, quote_data: schemas.QuoteFromDeal, db: S
         db.refresh(db_quote)
         
         # Add items
-        for item in quote_data.items:
-            line_total = item.quantity * item.unit_price
-            discount = line_total * (item.discount_percent / 100)
-            discounted_total = line_total - discount
-            vat_amount = discounted_total * (item.vat_rate / 100)
-            total_with_vat = discounted_total + vat_amount
-            
-            subtotal += line_total
-            total_discount += discount
-            total_vat += vat_amount
-            
-            db_item = models.QuoteItem(
-                quote_id=db_quote.id,
-                product_id=item.product_id,
-                description=item.description,
-                quantity=item.quantity,
-                unit=getattr(item, 'unit', 'Adet'),
-                unit_price=item.unit_price,
-                discount_percent=item.discount_percent,
-                vat_rate=item.vat_rate,
-                line_total=line_total,
-                vat_amount=vat_amount,
-                total_with_vat=total_with_vat
-            )
-            db.add(db_item)
+        item_rows, subtotal, total_discount, total_vat = build_quote_items(db_quote.id, quote_data.items)
+        db.bulk_insert_mappings(models.QuoteItem, item_rows)
         
         db_quote.subtotal = subtotal
         db_quote.discount_amount = total_discount
@@ -205,6 +228,18 @@ def convert_deal_to_quote(deal_id: int, quote_data: schemas.QuoteFromDeal, db: S
 
 # ==================== QUOTES ====================
 
+# schemas.Quote serializes items (with product), account and one level of
+# revisions; load them up front instead of lazily per row
+QUOTE_RESPONSE_OPTIONS = (
+    selectinload(models.Quote.items).selectinload(models.QuoteItem.product),
+    selectinload(models.Quote.account),
+    selectinload(models.Quote.revisions).options(
+        selectinload(models.Quote.items).selectinload(models.QuoteItem.product),
+        selectinload(models.Quote.account),
+    ),
+)
+
+
 @router.post("/quotes", response_model=schemas.Quote)
 def create_quote(quote: schemas.QuoteCreate, db: Session = Depends(get_db)):
     """Doğrudan teklif oluştur (fırsat olmadan)"""
@@ -215,10 +250,6 @@ def create_quote(quote: schemas.QuoteCreate, db: Session = Depends(get_db)):
         else:
             quote_no = quote.quote_no
         
-        subtotal = 0.0
-        total_vat = 0.0
-        total_discount = 0.0
-        
         db_quote = models.Quote(
             quote_no=quote.quote_no or quote_no,
             deal_id=quote.deal_id,
@@ -233,31 +264,8 @@ def create_quote(quote: schemas.QuoteCreate, db: Session = Depends(get_db)):
         db.flush() # Flush to get ID
         db.refresh(db_quote)
         
-        for item in quote.items:
-            line_total = item.quantity * item.unit_price
-            discount = line_total * (item.discount_percent / 100)
-            discounted_total = line_total - discount
-            vat_amount = discounted_total * (item.vat_rate / 100)
-            total_with_vat = discounted_total + vat_amount
-            
-            subtotal += line_total
-            total_discount += discount
-            total_vat += vat_amount
-            
-            db_item = models.QuoteItem(
-                quote_id=db_quote.id,
-                product_id=item.product_id,
-                description=item.description,
-                quantity=item.quantity,
-                unit=getattr(item, 'unit', 'Adet'),
-                unit_price=item.unit_price,
-                discount_percent=item.discount_percent,
-                vat_rate=item.vat_rate,
-                line_total=line_total,
-                vat_amount=vat_amount,
-                total_with_vat=total_with_vat
-            )
-            db.add(db_item)
+        item_rows, subtotal, total_discount, total_vat = build_quote_items(db_quote.id, quote.items)
+        db.bulk_insert_mappings(models.QuoteItem, item_rows)
         
         db_quote.subtotal = subtotal
         db_quote.discount_amount = total_discount
@@ -273,7 +281,7 @@ def create_quote(quote: schemas.QuoteCreate, db: Session = Depends(get_db)):
 
 @router.get("/quotes", response_model=List[schemas.Quote])
 def read_quotes(status: str = None, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    query = db.query(models.Quote)
+    query = db.query(models.Quote).options(*QUOTE_RESPONSE_OPTIONS)
     if status:
         query = query.filter(models.Quote.status == status)
     quotes = query.order_by(models.Quote.created_at.desc()).offset(skip).limit(limit).all()
@@ -282,7 +290,9 @@ def read_quotes(status: str = None, skip: int = 0, limit: int = 100, db: Session
 @router.get("/quotes/grouped", response_model=List[schemas.Quote])
 def read_quotes_grouped(status: str = None, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """Ana teklifleri revizyonlarıyla birlikte getir (sadece root quotes)"""
-    query = db.query(models.Quote).filter(models.Quote.parent_quote_id == None)
+    query = db.query(models.Quote).options(
+        *QUOTE_RESPONSE_OPTIONS
+    ).filter(models.Quote.parent_quote_id == None)
     if status:
         query = query.filter(models.Quote.status == status)
     quotes = query.order_by(models.Quote.created_at.desc()).offset(skip).limit(limit).all()
@@ -290,7 +300,9 @@ def read_quotes_grouped(status: str = None, skip: int = 0, limit: int = 100, db:
 
 @router.get("/quotes/{quote_id}", response_model=schemas.Quote)
 def read_quote(quote_id: int, db: Session = Depends(get_db)):
-    db_quote = db.query(models.Quote).filter(models.Quote.id == quote_id).first()
+    db_quote = db.query(models.Quote).options(
+        *QUOTE_RESPONSE_OPTIONS
+    ).filter(models.Quote.id == quote_id).first()
     if not db_quote:
         raise HTTPException(status_code=404, detail="Quote not found")
     return db_quote
@@ -312,39 +324,31 @@ def update_quote(quote_id: int, quote: schemas.QuoteUpdate, db: Session = Depend
     if quote.notes is not None:
         db_quote.notes = quote.notes
     
-    # Delete old items
-    db.query(models.QuoteItem).filter(models.QuoteItem.quote_id == quote_id).delete()
-    
-    # Recalculate totals and add new items
-    subtotal = 0.0
-    total_vat = 0.0
-    total_discount = 0.0
-    
-    for item in quote.items:
-        line_total = item.quantity * item.unit_price
-        discount = line_total * (item.discount_percent / 100)
-        discounted_total = line_total - discount
-        vat_amount = discounted_total * (item.vat_rate / 100)
-        total_with_vat = discounted_total + vat_amount
-        
-        subtotal += line_total
-        total_discount += discount
-        total_vat += vat_amount
+    # Recalculate totals
+    item_rows, subtotal, total_discount, total_vat = build_quote_items(db_quote.id, quote.items)
+    
+    if any(item.id is not None for item in quote.items):
+        # Items carry ids: only write the delta
+        existing = {row.id: row for row in db_quote.items}
+        changed_rows = []
+        new_rows = []
+        for item, row in zip(quote.items, item_rows):
+            current = existing.pop(item.id, None)
+            if current is None:
+                new_rows.append(row)
+            elif any(getattr(current, key) != value for key, value in row.items()):
+                changed_rows.append({"id": item.id, **row})
         
-        db_item = models.QuoteItem(
-            quote_id=db_quote.id,
-            product_id=item.product_id,
-            description=item.description,
-            quantity=item.quantity,
-            unit=getattr(item, 'unit', 'Adet'),
-            unit_price=item.unit_price,
-            discount_percent=item.discount_percent,
-            vat_rate=item.vat_rate,
-            line_total=line_total,
-            vat_amount=vat_amount,
-            total_with_vat=total_with_vat
-        )
-        db.add(db_item)
+        if existing:
+            db.query(models.QuoteItem).filter(
+                models.QuoteItem.id.in_(existing.keys())
+            ).delete(synchronize_session=False)
+        db.bulk_update_mappings(models.QuoteItem, changed_rows)
+        db.bulk_insert_mappings(models.QuoteItem, new_rows)
+    else:
+        # No ids sent: replace the whole item list
+        db.query(models.QuoteItem).filter(models.QuoteItem.quote_id == quote_id).delete()
+        db.bulk_insert_mappings(models.QuoteItem, item_rows)
     
     db_quote.subtotal = subtotal
     db_quote.discount_amount = total_discount
@@ -358,13 +362,17 @@ def update_quote(quote_id: int, quote: schemas.QuoteUpdate, db: Session = Depend
 @router.patch("/quotes/{quote_id}/status")
 def update_quote_status(quote_id: int, status: str, db: Session = Depends(get_db)):
     """Teklif durumunu güncelle"""
-    db_quote = db.query(models.Quote).filter(models.Quote.id == quote_id).first()
+    db_quote = db.scalars(
+        update(models.Quote)
+        .where(models.Quote.id == quote_id)
+        .values(status=status)
+        .returning(models.Quote)
+    ).first()
     if not db_quote:
         raise HTTPException(status_code=404, detail="Quote not found")
     
-    db_quote.status = status
+    db.expunge(db_quote)
     db.commit()
-    db.refresh(db_quote)
     return db_quote
 
 @router.post("/quotes/{quote_id}/revise", response_model=schemas.Quote)
@@ -469,9 +477,11 @@ def convert_quote_to_order(quote_id: int, db: Session = Depends(get_db)):
     
     # Update deal status if exists
     if db_quote.deal_id:
-        db_deal = db.query(models.Deal).filter(models.Deal.id == db_quote.deal_id).first()
-        if db_deal:
-            db_deal.status = models.DealStatus.ORDER_RECEIVED
+        db.execute(
+            update(models.Deal)
+            .where(models.Deal.id == db_quote.deal_id)
+            .values(status=models.DealStatus.ORDER_RECEIVED)
+        )
     
     db.commit()
     db.refresh(db_order)
@@ -483,6 +493,8 @@ def convert_quote_to_order(quote_id: int, db: Session = Depends(get_db)):
 
 from fastapi.responses import StreamingResponse
 from io import BytesIO
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -490,7 +502,12 @@ from reportlab.lib.units import mm
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from functools import lru_cache
+import copy
 import os
+import re
+
+from ..stream_utils import iter_file_chunks
 
 # Register Turkish-supporting fonts (DejaVu Sans)
 FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts')
@@ -501,6 +518,10 @@ def register_fonts():
     global FONT_REGISTERED
     if FONT_REGISTERED:
         return
+    if {'DejaVuSans', 'DejaVuSans-Bold'} <= set(pdfmetrics.getRegisteredFontNames()):
+        # Already registered by another PDF module in this process
+        FONT_REGISTERED = True
+        return
     
     try:
         dejavu_path = os.path.join(FONTS_DIR, 'DejaVuSans.ttf')
@@ -527,6 +548,11 @@ def register_fonts():
     except Exception as e:
         print(f"Font registration warning: {e}")
 
+# Parse the TTFs once per process (pool workers inherit or re-import this)
+register_fonts()
+PDF_FONT_NAME = 'DejaVuSans' if FONT_REGISTERED else 'Helvetica'
+PDF_FONT_NAME_BOLD = 'DejaVuSans-Bold' if FONT_REGISTERED else 'Helvetica-Bold'
+
 # Currency symbols
 CURRENCY_SYMBOLS = {
     'TRY': '₺',
@@ -535,10 +561,32 @@ CURRENCY_SYMBOLS = {
     'GBP': '£'
 }
 
+# Leading "Ödeme ve Teslim Koşulları" header (with optional ":" / "-") in quote notes
+NOTES_HEADER_RE = re.compile(r'^\s*Ödeme ve Teslim Koşulları\s*[-:]?\s*', re.IGNORECASE)
+
+def split_quote_notes(notes: str) -> List[str]:
+    """Split quote notes into condition bullets (header removed, blanks dropped).
+
+    Line breaks win when present, so dashes inside a line stay in that line;
+    otherwise " - " separates items, and bare "a-b-c" lists split on "-".
+    """
+    notes_text = NOTES_HEADER_RE.sub('', notes, count=1)
+    if "\n" in notes_text:
+        items = notes_text.split("\n")
+    elif " - " in notes_text:
+        items = notes_text.split(" - ")
+    elif notes_text.count("-") >= 2:
+        items = notes_text.split("-")
+    else:
+        items = [notes_text]
+    return [item.strip() for item in items if item.strip()]
+
+@lru_cache(maxsize=512)
 def format_currency(amount: float, currency: str = 'TRY') -> str:
     symbol = CURRENCY_SYMBOLS.get(currency, currency)
     return f"{symbol}{amount:,.2f}"
 from reportlab.platypus import Image as RLImage
+from reportlab.lib.utils import ImageReader
 
 # Assets directory for header/footer images
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
@@ -551,6 +599,54 @@ PIKOLAB_DARK_PURPLE = '#5b21b6'  # Violet-800
 PIKOLAB_LIGHT_PURPLE = '#ede9fe'  # Violet-100
 PIKOLAB_GRAY = '#334155'  # Slate-700
 
+
+@lru_cache(maxsize=4)
+def get_item_table_styles(font_name: str, font_name_bold: str) -> tuple:
+    """Items table ParagraphStyles, built once per font pair and shared across PDFs"""
+    header_cell_style = ParagraphStyle(
+        'HeaderCell',
+        fontName=font_name_bold,
+        fontSize=9,
+        textColor=colors.white,
+        alignment=1  # Center
+    )
+    # Description style for table cells - allows text wrapping
+    desc_style = ParagraphStyle(
+        'DescriptionStyle',
+        fontName=font_name,
+        fontSize=8,
+        leading=11,
+        wordWrap='CJK',
+        textColor=colors.HexColor(PIKOLAB_GRAY)
+    )
+    return header_cell_style, desc_style
+
+
+# Asset placement is fixed at deploy time, so check it once
+SIGNATURE_PATH = os.path.join(ASSETS_DIR, 'signature.png')
+SIGNATURE_AVAILABLE = os.path.exists(SIGNATURE_PATH)
+
+QUOTE_HEADER_PATH = os.path.join(ASSETS_DIR, 'quote_header.png')
+QUOTE_FOOTER_PATH = os.path.join(ASSETS_DIR, 'quote_footer.png')
+
+def get_image_aspect(path: str):
+    """Height/width ratio of an image asset, or None when it is missing"""
+    if not os.path.exists(path):
+        return None
+    iw, ih = ImageReader(path).getSize()
+    return ih / float(iw)
+
+QUOTE_HEADER_ASPECT = get_image_aspect(QUOTE_HEADER_PATH)
+QUOTE_FOOTER_ASPECT = get_image_aspect(QUOTE_FOOTER_PATH)
+
+@lru_cache(maxsize=1)
+def get_signature_image() -> RLImage:
+    """Signature flowable template; callers append a copy since flowables hold layout state"""
+    # Slightly smaller signature to fit nicely
+    sig_img = RLImage(SIGNATURE_PATH, width=45*mm, height=22*mm)
+    sig_img.hAlign = 'RIGHT'
+    return sig_img
+
 from ..services import mail_service
 
 @router.post("/quotes/{quote_id}/send")
@@ -629,46 +725,83 @@ async def send_quote_email(quote_id: int, db: Session = Depends(get_db)):
         db.commit()
         raise HTTPException(status_code=500, detail=f"Email sending failed: {str(e)}")
 
-@router.get("/quotes/{quote_id}/pdf")
-def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
-    """Generate PDF for a quote with Turkish character support and Pikolab branding"""
-    
-    # Register fonts for Turkish characters
-    register_fonts()
-    
-    quote = db.query(models.Quote).filter(models.Quote.id == quote_id).first()
+# Everything quote_to_pdf_data reads; of the project only the technopark flag
+QUOTE_PDF_OPTIONS = (
+    selectinload(models.Quote.account),
+    selectinload(models.Quote.items),
+    selectinload(models.Quote.project).load_only(models.Project.is_technopark_project),
+)
+
+
+def quote_to_pdf_data(quote: models.Quote) -> dict:
+    """Flatten a quote into plain data that can be pickled into a PDF worker process"""
+    account = quote.account
+    return {
+        "quote_no": quote.quote_no,
+        "created_at": quote.created_at,
+        "valid_until": quote.valid_until,
+        "currency": quote.currency or 'TRY',
+        "notes": quote.notes,
+        "subtotal": quote.subtotal,
+        "discount_amount": quote.discount_amount,
+        "vat_amount": quote.vat_amount,
+        "total_amount": quote.total_amount,
+        "account": {
+            "title": account.title,
+            "tax_id": account.tax_id,
+            "tax_office": account.tax_office,
+            "address": account.address,
+        } if account else None,
+        "items": [
+            {
+                "description": item.description,
+                "quantity": item.quantity,
+                "unit_price": item.unit_price,
+                "discount_percent": item.discount_percent,
+                "vat_rate": item.vat_rate,
+                "total_with_vat": item.total_with_vat,
+            }
+            for item in quote.items
+        ],
+        "is_technopark_project": bool(
+            quote.project and getattr(quote.project, 'is_technopark_project', False)
+        ),
+    }
+
+
+def fetch_quote_pdf_data(db: Session, quote_id: int):
+    """Load a quote with everything the PDF shows and flatten it for rendering (None if missing)"""
+    quote = db.query(models.Quote).options(*QUOTE_PDF_OPTIONS).filter(
+        models.Quote.id == quote_id
+    ).first()
     if not quote:
-        raise HTTPException(status_code=404, detail="Teklif bulunamadı")
-    
-    # Determine which font to use
-    font_name = 'DejaVuSans' if FONT_REGISTERED else 'Helvetica'
-    font_name_bold = 'DejaVuSans-Bold' if FONT_REGISTERED else 'Helvetica-Bold'
+        return None
+    return quote_to_pdf_data(quote)
+
+
+def fetch_quotes_pdf_data(db: Session, quote_ids: List[int]) -> List[dict]:
+    """Load and flatten several quotes for rendering, in quote_ids order (missing ids skipped)"""
+    quotes = db.query(models.Quote).options(*QUOTE_PDF_OPTIONS).filter(
+        models.Quote.id.in_(quote_ids)
+    ).all()
+    by_id = {quote.id: quote for quote in quotes}
+    return [quote_to_pdf_data(by_id[quote_id]) for quote_id in dict.fromkeys(quote_ids) if quote_id in by_id]
+
+
+def build_quote_pdf(quote: dict) -> bytes:
+    """
+    Render a quote PDF from quote_to_pdf_data() output.
+    Runs inside the PDF pool's worker processes, so it must not touch the database.
+    """
+    # Fonts are registered at import time
+    font_name = PDF_FONT_NAME
+    font_name_bold = PDF_FONT_NAME_BOLD
     
     # Page dimensions
     page_width, page_height = A4
     
     # Create PDF buffer
     buffer = BytesIO()
-    # Function to draw header/footer on each page
-    def draw_header_footer(canvas, doc):
-        canvas.saveState()
-        
-        # Header Image
-        header_path = os.path.join(ASSETS_DIR, 'quote_header.png')
-        if os.path.exists(header_path):
-            # Draw header full width at top
-            # A4 width is ~595 pts. Assume header is designed for full width.
-            # Height: let's pick reasonable height or calc from aspect logic.
-            # For now, let's assume it's a banner, say 40mm high? Or just use "preserveAspectRatio".
-            # Let's say we want it to span the full width of the page (0 to page_width)
-            
-            img_width = page_width
-            img_height = 35 * mm # Approximate height for a header banner
-            
-            canvas.drawImage(header_path, 0, page_height - img_height, width=img_width, height=img_height, mask='auto', preserveAspectRatio=False) # Stretch to fit width
-            
-        canvas.restoreState()
-
     doc = SimpleDocTemplate(
         buffer, 
         pagesize=A4,
@@ -716,16 +849,6 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
         textColor=colors.HexColor(PIKOLAB_PURPLE)
     )
     
-    # Description style for table cells - allows text wrapping
-    desc_style = ParagraphStyle(
-        'DescriptionStyle',
-        fontName=font_name,
-        fontSize=8,
-        leading=11,
-        wordWrap='CJK',
-        textColor=colors.HexColor(PIKOLAB_GRAY)
-    )
-    
     # ==================== INFO BOX (Combined Quote & Customer Info) ====================
     
     # Title
@@ -733,25 +856,26 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     elements.append(Spacer(1, 10))
     
     # Combined info table - left side: customer, right side: quote details
-    currency = quote.currency or 'TRY'
+    currency = quote["currency"]
     
     # Left column data (Customer)
     customer_info = ""
-    if quote.account:
+    account = quote["account"]
+    if account:
         customer_info = f"""
-        <b>Sayın:</b> {quote.account.title or '-'}<br/>
-        <b>Vergi No:</b> {quote.account.tax_id or '-'}<br/>
-        <b>Vergi Dairesi:</b> {quote.account.tax_office or '-'}<br/>
-        <b>Adres:</b> {quote.account.address or '-'}
+        <b>Sayın:</b> {account['title'] or '-'}<br/>
+        <b>Vergi No:</b> {account['tax_id'] or '-'}<br/>
+        <b>Vergi Dairesi:</b> {account['tax_office'] or '-'}<br/>
+        <b>Adres:</b> {account['address'] or '-'}
         """
     else:
         customer_info = "<b>Müşteri bilgisi bulunamadı</b>"
     
     # Right column data (Quote details)
-    valid_until_str = quote.valid_until.strftime('%d.%m.%Y') if quote.valid_until else '-'
+    valid_until_str = quote["valid_until"].strftime('%d.%m.%Y') if quote["valid_until"] else '-'
     quote_info = f"""
-    <b>Teklif No:</b> {quote.quote_no}<br/>
-    <b>Tarih:</b> {quote.created_at.strftime('%d.%m.%Y')}<br/>
+    <b>Teklif No:</b> {quote['quote_no']}<br/>
+    <b>Tarih:</b> {quote['created_at'].strftime('%d.%m.%Y')}<br/>
     <b>Geçerlilik:</b> {valid_until_str}<br/>
     <b>Para Birimi:</b> {currency}
     """
@@ -786,23 +910,7 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     
     # ==================== ITEMS TABLE ====================
     
-    # Header style for table
-    header_cell_style = ParagraphStyle(
-        'HeaderCell',
-        fontName=font_name_bold,
-        fontSize=9,
-        textColor=colors.white,
-        alignment=1  # Center
-    )
-    
-    # Data style for right-aligned cells
-    data_style_right = ParagraphStyle(
-        'DataStyleRight',
-        fontName=font_name,
-        fontSize=8,
-        alignment=2,  # RIGHT
-        textColor=colors.HexColor(PIKOLAB_GRAY)
-    )
+    header_cell_style, desc_style = get_item_table_styles(font_name, font_name_bold)
     
     items_header = [
         Paragraph("<b>Açıklama</b>", header_cell_style),
@@ -812,25 +920,31 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
         Paragraph("<b>KDV</b>", header_cell_style),
         Paragraph("<b>Toplam</b>", header_cell_style)
     ]
-    items_data = [items_header]
-    
-    for item in quote.items:
-        desc_text = item.description or "-"
-        desc_paragraph = Paragraph(desc_text, desc_style)
-        
-        items_data.append([
-            desc_paragraph,
-            Paragraph(str(item.quantity), data_style_right),
-            Paragraph(format_currency(item.unit_price, currency), data_style_right),
-            Paragraph(f"%{item.discount_percent or 0}", data_style_right),
-            Paragraph(f"%{item.vat_rate}", data_style_right),
-            Paragraph(format_currency(item.total_with_vat, currency), data_style_right)
-        ])
+    # Only the description needs Paragraph wrapping; numeric cells are plain
+    # strings styled through the TableStyle below, skipping paragraph layout.
+    items_data = [items_header] + [
+        [
+            Paragraph(item["description"] or "-", desc_style),
+            str(item["quantity"]),
+            format_currency(item["unit_price"], currency),
+            f"%{item['discount_percent'] or 0}",
+            f"%{item['vat_rate']}",
+            format_currency(item["total_with_vat"], currency)
+        ]
+        for item in quote["items"]
+    ]
     
     # Column widths based on usable width
     col_widths = [usable_width * 0.35, usable_width * 0.10, usable_width * 0.15, 
                   usable_width * 0.12, usable_width * 0.10, usable_width * 0.18]
     
+    # Alternating row colors as explicit commands; white rows need none
+    row_alt_color = colors.HexColor('#FAF7FC')
+    row_backgrounds = [
+        ('BACKGROUND', (0, row), (-1, row), row_alt_color)
+        for row in range(2, len(items_data), 2)
+    ]
+    
     items_table = Table(items_data, colWidths=col_widths)
     items_table.setStyle(TableStyle([
         # Header row - Pikolab purple gradient effect
@@ -845,11 +959,14 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
         ('TOPPADDING', (0, 1), (-1, -1), 8),
         ('LEFTPADDING', (0, 0), (-1, -1), 6),
         ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        # Numeric data cells (plain strings)
+        ('FONTNAME', (1, 1), (-1, -1), font_name),
+        ('FONTSIZE', (1, 1), (-1, -1), 8),
+        ('TEXTCOLOR', (1, 1), (-1, -1), colors.HexColor(PIKOLAB_GRAY)),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
         # Grid with light purple
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(PIKOLAB_LIGHT_PURPLE)),
-        # Alternating row colors
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FAF7FC')]),
-    ]))
+    ] + row_backgrounds))
     elements.append(items_table)
     elements.append(Spacer(1, 15))
     
@@ -872,9 +989,9 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     )
     
     totals_data = [
-        [Paragraph("Ara Toplam:", totals_label_style), Paragraph(format_currency(quote.subtotal, currency), totals_value_style)],
-        [Paragraph("İskonto:", totals_label_style), Paragraph(f"-{format_currency(quote.discount_amount, currency)}", totals_value_style)],
-        [Paragraph("KDV:", totals_label_style), Paragraph(format_currency(quote.vat_amount, currency), totals_value_style)],
+        [Paragraph("Ara Toplam:", totals_label_style), Paragraph(format_currency(quote['subtotal'], currency), totals_value_style)],
+        [Paragraph("İskonto:", totals_label_style), Paragraph(f"-{format_currency(quote['discount_amount'], currency)}", totals_value_style)],
+        [Paragraph("KDV:", totals_label_style), Paragraph(format_currency(quote['vat_amount'], currency), totals_value_style)],
     ]
     
     totals_table = Table(totals_data, colWidths=[usable_width * 0.75, usable_width * 0.25])
@@ -904,7 +1021,7 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     
     grand_total_data = [[
         Paragraph("GENEL TOPLAM:", grand_total_label_style),
-        Paragraph(format_currency(quote.total_amount, currency), grand_total_value_style)
+        Paragraph(format_currency(quote["total_amount"], currency), grand_total_value_style)
     ]]
     
     grand_total_table = Table(grand_total_data, colWidths=[usable_width * 0.75, usable_width * 0.25])
@@ -923,57 +1040,36 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     # --- Left Content: Conditions ---
     left_content = []
     
-    if quote.notes:
+    if quote["notes"]:
         left_content.append(Paragraph("ÖDEME VE TESLİM KOŞULLARI", heading_style))
         left_content.append(Spacer(1, 5))
         
-        notes_text = quote.notes
-        
-        # Clean header if exists
-        header_cleanup = "Ödeme ve Teslim Koşulları"
-        if notes_text.strip().lower().startswith(header_cleanup.lower()):
-            notes_text = notes_text[len(header_cleanup):].strip()
-            if notes_text.startswith("-") or notes_text.startswith(":"):
-                notes_text = notes_text[1:].strip()
-        
-        # Split logic
-        if "\n" in notes_text:
-            items = notes_text.split("\n")
-        elif " - " in notes_text:
-            items = notes_text.split(" - ") 
-        else:
-            if notes_text.count("-") >= 2:
-                 items = notes_text.split("-")
-            else:
-                items = [notes_text]
-        
         # Smaller font style for conditions
         cond_style = ParagraphStyle(
             'ConditionsStyle',
             fontName=font_name,
             fontSize=7,  # Reduced to 7pt
-            leading=8,   # Reduced line spacing
+            leading=14,  # Same 14pt bullet pitch as the old 8pt leading + 3pt/3pt row padding
             textColor=colors.HexColor(PIKOLAB_GRAY)
         )
         
-        clean_items = []
-        for item in items:
-            item = item.strip()
-            if not item: continue
-            clean_items.append([Paragraph(f"• {item}", cond_style)])
+        clean_items = split_quote_notes(quote["notes"])
             
         if clean_items:
+            # One multi-line paragraph instead of a table row per bullet
+            conditions = Paragraph("<br/>".join(f"• {item}" for item in clean_items), cond_style)
+            
             # Inner table for background color
             # Width calculation: 60% of usbale width minus some padding
             cond_width = (usable_width * 0.6) - 5
-            cond_table = Table(clean_items, colWidths=[cond_width])
+            cond_table = Table([[conditions]], colWidths=[cond_width])
             cond_table.setStyle(TableStyle([
                 ('VALIGN', (0, 0), (-1, -1), 'TOP'),
                 ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F8F4FB')),
                 ('LEFTPADDING', (0, 0), (-1, -1), 8),
                 ('RIGHTPADDING', (0, 0), (-1, -1), 8),
                 ('TOPPADDING', (0, 0), (-1, -1), 3),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
             ]))
             left_content.append(cond_table)
     
@@ -999,19 +1095,14 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     right_content.append(Paragraph("Teklifi Hazırlayan", signature_title_style))
     right_content.append(Spacer(1, 2))  # Reduced spacing
     
-    signature_path = os.path.join(ASSETS_DIR, 'signature.png')
-    if os.path.exists(signature_path):
+    if SIGNATURE_AVAILABLE:
         try:
-            # Slightly smaller signature to fit nicely
-            sig_img = RLImage(signature_path, width=45*mm, height=22*mm)
-            sig_img.hAlign = 'RIGHT'
-            right_content.append(sig_img)
+            right_content.append(copy.copy(get_signature_image()))
         except:
             pass
             
     right_content.append(Spacer(1, 1))  # Reduced spacing significantly
-    right_content.append(Paragraph("________________________", signature_name_style))
-    right_content.append(Paragraph("Pikolab Arge Ltd. Şti.", signature_name_style))
+    right_content.append(Paragraph("________________________<br/>Pikolab Arge Ltd. Şti.", signature_name_style))
     
     # --- Main Layout Table ---
     # colWidths: 60% for conditions, 40% for signature
@@ -1028,7 +1119,7 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     
     # ==================== TECHNOPARK EXEMPTION ====================
     
-    if quote.project and hasattr(quote.project, 'is_technopark_project') and quote.project.is_technopark_project:
+    if quote["is_technopark_project"]:
         elements.append(Spacer(1, 15))
         exemption_style = ParagraphStyle(
             'Exemption',
@@ -1046,62 +1137,90 @@ def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
     
     # ==================== HEADER AND FOOTER ====================
     
+    # Full-width (edge to edge) header/footer sizes are fixed for the whole document
+    if QUOTE_HEADER_ASPECT is not None:
+        header_height = page_width * QUOTE_HEADER_ASPECT
+    if QUOTE_FOOTER_ASPECT is not None:
+        footer_height = page_width * QUOTE_FOOTER_ASPECT
+    
+    # drawImage wraps its own q/Q pair and leaves no graphics state behind,
+    # so no saveState/restoreState is needed around these calls
     def add_header_footer(canvas, doc):
-        canvas.saveState()
-        
-        # Header image - FULL WIDTH (edge to edge)
-        header_path = os.path.join(ASSETS_DIR, 'quote_header.png')
-        if os.path.exists(header_path):
-            from reportlab.lib.utils import ImageReader
-            img = ImageReader(header_path)
-            iw, ih = img.getSize()
-            aspect = ih / float(iw)
-            
-            header_width = page_width  # Full page width
-            header_height = header_width * aspect
-            
+        # Header image aligned to the top
+        if QUOTE_HEADER_ASPECT is not None:
             canvas.drawImage(
-                header_path, 
+                QUOTE_HEADER_PATH, 
                 0,  # Start from left edge
                 page_height - header_height, # Align to top
-                width=header_width, 
+                width=page_width, 
                 height=header_height,
                 preserveAspectRatio=True,
                 mask='auto'
             )
         
-        # Footer image - FULL WIDTH (edge to edge)
-        footer_path = os.path.join(ASSETS_DIR, 'quote_footer.png')
-        if os.path.exists(footer_path):
-            from reportlab.lib.utils import ImageReader
-            img = ImageReader(footer_path)
-            iw, ih = img.getSize()
-            aspect = ih / float(iw)
-            
-            footer_width = page_width  # Full page width
-            footer_height = footer_width * aspect
-            
+        # Footer image at the bottom of the page
+        if QUOTE_FOOTER_ASPECT is not None:
             canvas.drawImage(
-                footer_path, 
+                QUOTE_FOOTER_PATH, 
                 0,  # Start from left edge
                 0,  # Bottom of page
-                width=footer_width, 
+                width=page_width, 
                 height=footer_height,
                 preserveAspectRatio=True,
                 mask='auto'
             )
-        
-        canvas.restoreState()
     
     # Build PDF with header/footer
     doc.build(elements, onFirstPage=add_header_footer, onLaterPages=add_header_footer)
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+@router.get("/quotes/{quote_id}/pdf")
+async def generate_quote_pdf(quote_id: int, db: Session = Depends(get_db)):
+    """Generate PDF for a quote with Turkish character support and Pikolab branding"""
+    # Blocking DB work runs in a thread, rendering in a worker process,
+    # so the event loop and the GIL stay free throughout
+    quote_data = await asyncio.to_thread(fetch_quote_pdf_data, db, quote_id)
+    if quote_data is None:
+        raise HTTPException(status_code=404, detail="Teklif bulunamadı")
+    
+    try:
+        pdf_bytes = await run_in_pdf_pool(build_quote_pdf, quote_data)
+    except BrokenProcessPool:
+        raise HTTPException(status_code=500, detail="PDF oluşturulamadı")
     
     # Return as streaming response
-    filename = f"Teklif_{quote.quote_no}.pdf"
+    filename = f"Teklif_{quote_data['quote_no']}.pdf"
     return StreamingResponse(
-        buffer,
+        iter_file_chunks(BytesIO(pdf_bytes)),
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
+
+@router.post("/quotes/bulk-pdf")
+async def generate_quotes_bulk_pdf(request: schemas.QuoteBulkPdfRequest, db: Session = Depends(get_db)):
+    """Birden fazla teklifin PDF'lerini tek ZIP arşivi olarak indir"""
+    quotes_data = await asyncio.to_thread(fetch_quotes_pdf_data, db, request.quote_ids)
+    if not quotes_data or len(quotes_data) != len(set(request.quote_ids)):
+        raise HTTPException(status_code=404, detail="Teklif bulunamadı")
+    
+    # Render every quote concurrently across the PDF worker processes
+    try:
+        pdfs = await asyncio.gather(*[
+            run_in_pdf_pool(build_quote_pdf, quote_data) for quote_data in quotes_data
+        ])
+    except BrokenProcessPool:
+        raise HTTPException(status_code=500, detail="PDF oluşturulamadı")
+    
+    # PDFs are already compressed, so store them as-is
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for quote_data, pdf_bytes in zip(quotes_data, pdfs):
+            archive.writestr(f"Teklif_{quote_data['quote_no']}.pdf", pdf_bytes)
+    
+    return StreamingResponse(
+        iter_file_chunks(buffer),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=Teklifler.zip"}
+    )
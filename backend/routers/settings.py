@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Response
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
-import json
 from .. import models, schemas
+from .. import json_utils
 from ..database import get_db
 from .auth import get_current_active_user, get_current_user
 from ..services.tax_service import TaxService, get_tax_service
+from ..services.cache_service import TTLCache
+from ..services.tenant_settings_service import load_tenant_settings
+from ..services.technopark_report_service import AUTOFILL_CACHE
 
 router = APIRouter(
     prefix="/settings",
@@ -13,6 +16,7 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+
 @router.get("/company", response_model=schemas.CompanySettings)
 def get_company_info(
     current_user: models.User = Depends(get_current_active_user),
@@ -25,15 +29,8 @@ def get_company_info(
             return schemas.CompanySettings()
         raise HTTPException(status_code=400, detail="User is not associated with a tenant")
         
-    settings_json = current_user.tenant.settings
-    if not settings_json:
-        return schemas.CompanySettings()
-        
-    try:
-        settings_dict = json.loads(settings_json)
-        return schemas.CompanySettings(**settings_dict)
-    except json.JSONDecodeError:
-        return schemas.CompanySettings()
+    settings_dict = load_tenant_settings(current_user.tenant)
+    return schemas.CompanySettings(**settings_dict)
 
 @router.post("/company", response_model=schemas.CompanySettings)
 def update_company_info(
@@ -50,21 +47,16 @@ def update_company_info(
         raise HTTPException(status_code=400, detail="User is not associated with a tenant")
     
     # Mevcut ayarları al
-    current_settings_json = current_user.tenant.settings
-    current_settings = {}
-    if current_settings_json:
-        try:
-            current_settings = json.loads(current_settings_json)
-        except:
-            pass
+    current_settings = load_tenant_settings(current_user.tenant)
     
     # Yeni ayarları birleştir
-    new_settings = settings.model_dump(exclude_unset=True)
-    current_settings.update(new_settings)
+    # Alanlar düz değerler; gönderilenleri doğrudan oku (model_dump gerekmez)
+    current_settings.update({key: getattr(settings, key) for key in settings.model_fields_set})
     
     # Kaydet
-    current_user.tenant.settings = json.dumps(current_settings)
+    current_user.tenant.settings = json_utils.dumps(current_settings)
     db.commit()
+    AUTOFILL_CACHE.invalidate()
     
     return schemas.CompanySettings(**current_settings)
 
@@ -79,6 +71,20 @@ def read_settings(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 
 # ==================== TAX PARAMETERS ENDPOINTS ====================
 
+# Dashboard summaries are read-heavy and expensive (12 monthly passes per year);
+# a short TTL keeps them close to live data
+TAX_SUMMARY_CACHE = TTLCache(ttl_seconds=60)
+
+# Oran alanları (0-1 arası) ve hata mesajlarındaki adları
+TAX_RATE_FIELDS = (
+    ("venture_capital_rate", "Girişim sermayesi oranı"),
+    ("corporate_tax_rate", "Kurumlar vergisi oranı"),
+    ("vat_rate", "KDV oranı"),
+    ("remote_work_rate_informatics", "Bilişim personeli uzaktan çalışma oranı"),
+    ("remote_work_rate_other", "Diğer personel uzaktan çalışma oranı"),
+    ("sgk_employer_share_discount", "SGK işveren hissesi indirimi"),
+)
+
 @router.get("/tax-parameters", response_model=schemas.TaxParameters2026)
 def get_tax_parameters(
     year: int = 2026,
@@ -112,26 +118,16 @@ def update_tax_parameters(
         raise HTTPException(status_code=403, detail="Bu işlem için admin yetkisi gereklidir")
     
     # Validasyon - oranlar 0-1 arasında olmalı
-    if updates.venture_capital_rate is not None and not (0 <= updates.venture_capital_rate <= 1):
-        raise HTTPException(status_code=400, detail="Girişim sermayesi oranı 0-1 arasında olmalıdır")
-    
-    if updates.corporate_tax_rate is not None and not (0 <= updates.corporate_tax_rate <= 1):
-        raise HTTPException(status_code=400, detail="Kurumlar vergisi oranı 0-1 arasında olmalıdır")
-    
-    if updates.vat_rate is not None and not (0 <= updates.vat_rate <= 1):
-        raise HTTPException(status_code=400, detail="KDV oranı 0-1 arasında olmalıdır")
-    
-    if updates.remote_work_rate_informatics is not None and not (0 <= updates.remote_work_rate_informatics <= 1):
-        raise HTTPException(status_code=400, detail="Bilişim personeli uzaktan çalışma oranı 0-1 arasında olmalıdır")
-    
-    if updates.remote_work_rate_other is not None and not (0 <= updates.remote_work_rate_other <= 1):
-        raise HTTPException(status_code=400, detail="Diğer personel uzaktan çalışma oranı 0-1 arasında olmalıdır")
-    
-    if updates.sgk_employer_share_discount is not None and not (0 <= updates.sgk_employer_share_discount <= 1):
-        raise HTTPException(status_code=400, detail="SGK işveren hissesi indirimi 0-1 arasında olmalıdır")
+    for field, label in TAX_RATE_FIELDS:
+        value = getattr(updates, field)
+        if value is not None and not (0 <= value <= 1):
+            raise HTTPException(status_code=400, detail=f"{label} 0-1 arasında olmalıdır")
     
     tax_service = get_tax_service(db)
-    return tax_service.update_tax_parameters(year, updates)
+    params = tax_service.update_tax_parameters(year, updates)
+    TAX_SUMMARY_CACHE.invalidate()
+    AUTOFILL_CACHE.invalidate()
+    return params
 
 
 @router.get("/tax-parameters/calculate", response_model=schemas.MonthlyTaxCalculationResult)
@@ -150,9 +146,16 @@ def calculate_monthly_tax(
         raise HTTPException(status_code=400, detail="Ay 1-12 arasında olmalıdır")
     
     tenant_id = current_user.tenant_id
-    tax_service = get_tax_service(db)
-    
-    return tax_service.calculate_monthly_tax_summary(tenant_id, year, month)
+    cache_key = ("monthly", tenant_id, year, month)
+    body = TAX_SUMMARY_CACHE.get(cache_key)
+    if body is None:
+        tax_service = get_tax_service(db)
+        result = tax_service.calculate_monthly_tax_summary(tenant_id, year, month)
+        body = result.model_dump_json()
+        TAX_SUMMARY_CACHE.set(cache_key, body)
+    
+    # Önbellekte hazır JSON tutulur; yanıt yeniden doğrulanıp serileştirilmez
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/tax-parameters/yearly-summary", response_model=schemas.YearlyTaxSummary)
@@ -167,7 +170,13 @@ def get_yearly_tax_summary(
     Belirtilen yıl için toplam vergi avantajlarını hesaplar.
     """
     tenant_id = current_user.tenant_id
-    tax_service = get_tax_service(db)
-    
-    return tax_service.calculate_yearly_summary(tenant_id, year)
+    cache_key = ("yearly", tenant_id, year)
+    body = TAX_SUMMARY_CACHE.get(cache_key)
+    if body is None:
+        tax_service = get_tax_service(db)
+        result = tax_service.calculate_yearly_summary(tenant_id, year)
+        body = result.model_dump_json()
+        TAX_SUMMARY_CACHE.set(cache_key, body)
+    
+    return Response(content=body, media_type="application/json")
 
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 
 from .. import models, schemas
 from ..database import get_db
 from .auth import get_current_active_user
-from ..services.technopark_report_service import get_technopark_report_service
+from ..stream_utils import iter_file_chunks
+from ..services.technopark_report_service import AUTOFILL_CACHE, get_technopark_report_service
 
 router = APIRouter(
     prefix="/technopark-reports",
@@ -21,7 +22,13 @@ def list_reports(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
-    query = db.query(models.TechnoparkReport).filter(
+    # The response serializes every child collection; load them in bulk
+    query = db.query(models.TechnoparkReport).options(
+        selectinload(models.TechnoparkReport.project_entries),
+        selectinload(models.TechnoparkReport.project_progress_entries),
+        selectinload(models.TechnoparkReport.personnel_entries),
+        selectinload(models.TechnoparkReport.line_items),
+    ).filter(
         models.TechnoparkReport.tenant_id == current_user.tenant_id
     )
     if year:
@@ -40,8 +47,13 @@ def get_autofill_payload(
 ):
     if not 1 <= month <= 12:
         raise HTTPException(status_code=400, detail="Ay 1-12 arasında olmalıdır")
-    service = get_technopark_report_service(db)
-    return service.build_autofill_payload(current_user.tenant_id, year, month)
+    cache_key = (current_user.tenant_id, year, month)
+    payload = AUTOFILL_CACHE.get(cache_key)
+    if payload is None:
+        service = get_technopark_report_service(db)
+        payload = service.build_autofill_payload(current_user.tenant_id, year, month)
+        AUTOFILL_CACHE.set(cache_key, payload)
+    return payload
 
 
 @router.post("/upsert", response_model=schemas.TechnoparkReport)
@@ -51,7 +63,9 @@ def upsert_report(
     current_user: models.User = Depends(get_current_active_user),
 ):
     service = get_technopark_report_service(db)
-    return service.upsert_report(current_user.tenant_id, payload)
+    report = service.upsert_report(current_user.tenant_id, payload)
+    AUTOFILL_CACHE.invalidate((current_user.tenant_id, payload.year, payload.month))
+    return report
 
 
 @router.get("/{report_id}", response_model=schemas.TechnoparkReport)
@@ -83,8 +97,14 @@ def update_report(
     if not report:
         raise HTTPException(status_code=404, detail="Rapor bulunamadı")
 
+    old_period = (report.year, report.month)
     service = get_technopark_report_service(db)
-    return service.update_report(report_id, payload)
+    updated = service.update_report(report_id, payload)
+    # Invalidate after the write so a concurrent auto-fill cannot re-cache the old
+    # data; both the previous and the current period of the report are cleared
+    for year, month in {old_period, (updated.year, updated.month)}:
+        AUTOFILL_CACHE.invalidate((current_user.tenant_id, year, month))
+    return updated
 
 
 @router.get("/{report_id}/download")
@@ -103,8 +123,13 @@ def download_report(
     service = get_technopark_report_service(db)
     result = service.generate_official_pdf(report_id)
 
+    buffer = result["buffer"]
     return StreamingResponse(
-        result["buffer"],
+        iter_file_chunks(buffer),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={result['filename']}"},
+        headers={
+            "Content-Disposition": f"attachment; filename={result['filename']}",
+            "Content-Length": str(buffer.getbuffer().nbytes),
+            "Cache-Control": "private, max-age=300",
+        },
     )
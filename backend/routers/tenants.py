@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, is_unique_violation, row_to_dict
 from .auth import get_current_active_user, hash_password
+from ..services.technopark_report_service import AUTOFILL_CACHE
 
 router = APIRouter(
     prefix="/tenants",
@@ -26,13 +29,23 @@ def create_tenant(
     current_user: models.User = Depends(check_superadmin)
 ):
     """Create a new tenant (Superadmin only)"""
-    db_tenant = models.Tenant(**tenant.dict())
-    db.add(db_tenant)
+    # INSERT ... RETURNING hands back server defaults without a refresh;
+    # the unique slug index rejects duplicates
+    # The savepoint keeps a failed INSERT from discarding the rest of the session
+    try:
+        with db.begin_nested():
+            db_tenant = db.scalars(
+                insert(models.Tenant).values(**tenant.model_dump()).returning(models.Tenant)
+            ).one()
+    except IntegrityError as e:
+        if not is_unique_violation(e, "tenants", "slug"):
+            raise
+        raise HTTPException(status_code=400, detail="Tenant slug already exists")
+    db.expunge(db_tenant)
     db.commit()
-    db.refresh(db_tenant)
     return db_tenant
 
-@router.get("/", response_model=List[schemas.Tenant])
+@router.get("/", response_model=List[schemas.TenantSummary])
 def read_tenants(
     skip: int = 0, 
     limit: int = 100, 
@@ -40,8 +53,16 @@ def read_tenants(
     current_user: models.User = Depends(check_superadmin)
 ):
     """List all tenants (Superadmin only)"""
-    tenants = db.query(models.Tenant).offset(skip).limit(limit).all()
-    return tenants
+    # Only the listed columns; the settings blob is never shown in the list
+    rows = db.query(
+        models.Tenant.id,
+        models.Tenant.name,
+        models.Tenant.slug,
+        models.Tenant.is_active,
+        models.Tenant.created_at,
+    ).offset(skip).limit(limit).all()
+    # Rows come straight from typed columns; build the responses without re-validating
+    return [schemas.TenantSummary.model_construct(**row._mapping) for row in rows]
 
 @router.get("/{tenant_id}", response_model=schemas.Tenant)
 def read_tenant(
@@ -53,7 +74,7 @@ def read_tenant(
     tenant = db.query(models.Tenant).filter(models.Tenant.id == tenant_id).first()
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
-    return tenant
+    return schemas.Tenant.model_construct(**row_to_dict(tenant))
 
 @router.put("/{tenant_id}", response_model=schemas.Tenant)
 def update_tenant(
@@ -63,16 +84,24 @@ def update_tenant(
     current_user: models.User = Depends(check_superadmin)
 ):
     """Update tenant (Superadmin only)"""
-    db_tenant = db.query(models.Tenant).filter(models.Tenant.id == tenant_id).first()
+    # Flat scalar fields: read the ones that were sent instead of dumping the model
+    update_data = {key: getattr(tenant_update, key) for key in tenant_update.model_fields_set}
+    if update_data:
+        # UPDATE ... RETURNING: no load before the write, no refresh after it
+        db_tenant = db.scalars(
+            update(models.Tenant)
+            .where(models.Tenant.id == tenant_id)
+            .values(**update_data)
+            .returning(models.Tenant)
+        ).first()
+    else:
+        db_tenant = db.query(models.Tenant).filter(models.Tenant.id == tenant_id).first()
     if not db_tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     
-    update_data = tenant_update.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_tenant, key, value)
-    
+    db.expunge(db_tenant)
     db.commit()
-    db.refresh(db_tenant)
+    AUTOFILL_CACHE.invalidate()
     return db_tenant
 
 @router.post("/{tenant_id}/admin", response_model=schemas.User)
@@ -88,20 +117,23 @@ def create_tenant_admin(
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     
-    # Check if user exists
-    existing = db.query(models.User).filter(models.User.email == user.email).first()
-    if existing:
+    # The unique email index replaces a separate existence SELECT
+    try:
+        with db.begin_nested():
+            db_user = db.scalars(
+                insert(models.User).values(
+                    email=user.email,
+                    hashed_password=hash_password(user.password),
+                    full_name=user.full_name,
+                    role=models.UserRole.ADMIN,
+                    tenant_id=tenant_id,
+                    is_active=True
+                ).returning(models.User)
+            ).one()
+    except IntegrityError as e:
+        if not is_unique_violation(e, "users", "email"):
+            raise
         raise HTTPException(status_code=400, detail="Email already registered")
-    
-    db_user = models.User(
-        email=user.email,
-        hashed_password=hash_password(user.password),
-        full_name=user.full_name,
-        role=models.UserRole.ADMIN,
-        tenant_id=tenant_id,
-        is_active=True
-    )
-    db.add(db_user)
+    db.expunge(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
-from ..database import get_db
+from .. import json_utils
+from ..database import get_db, is_unique_violation
 from .auth import get_current_active_user, hash_password
 
 router = APIRouter(
@@ -28,16 +31,27 @@ def read_users(
     """Tenant içindeki kullanıcıları listele (Sadece Admin)"""
     check_admin_privileges(current_user)
     
+    # Only the columns schemas.User exposes (no password hash or payroll fields)
+    query = db.query(
+        models.User.id,
+        models.User.email,
+        models.User.full_name,
+        models.User.role,
+        models.User.is_active,
+        models.User.is_superuser,
+        models.User.created_at,
+    )
+    
     if current_user.role == models.UserRole.SUPERADMIN:
         # Superadmin hepsini görür
-        users = db.query(models.User).offset(skip).limit(limit).all()
+        users = query.offset(skip).limit(limit).all()
     else:
         # Tenant admin sadece kendi tenant userlarını görür
-        users = db.query(models.User).filter(
+        users = query.filter(
             models.User.tenant_id == current_user.tenant_id
         ).offset(skip).limit(limit).all()
-        
-    return users
+    
+    return json_utils.rows_response(users)
 
 @router.post("/", response_model=schemas.User)
 def create_user(
@@ -48,28 +62,31 @@ def create_user(
     """Yeni kullanıcı oluştur (Sadece Admin)"""
     check_admin_privileges(current_user)
     
-    # Email kontrolü
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user:
-        raise HTTPException(status_code=400, detail="Bu email adresi zaten kullanımda.")
-    
-    new_user = models.User(
-        email=user.email,
-        hashed_password=hash_password(user.password),
-        full_name=user.full_name,
-        role=user.role,
-        is_active=True,
-        tenant_id=current_user.tenant_id # Admin'in tenantına ekle
-    )
-    
     if current_user.role == models.UserRole.SUPERADMIN:
         # Superadmin ise tenant_id payload'dan gelebilir ama şimdilik basit tutalım
         # Varsayılan olarak superadmin kendi tenantına ekler veya explicit belirtilmeli
         pass
-        
-    db.add(new_user)
+    
+    # Email tekilliğini unique index kontrol eder; ayrı bir SELECT atılmaz.
+    # Savepoint sayesinde başarısız INSERT oturumun geri kalanını silmez
+    try:
+        with db.begin_nested():
+            new_user = db.scalars(
+                insert(models.User).values(
+                    email=user.email,
+                    hashed_password=hash_password(user.password),
+                    full_name=user.full_name,
+                    role=user.role,
+                    is_active=True,
+                    tenant_id=current_user.tenant_id # Admin'in tenantına ekle
+                ).returning(models.User)
+            ).one()
+    except IntegrityError as e:
+        if not is_unique_violation(e, "users", "email"):
+            raise
+        raise HTTPException(status_code=400, detail="Bu email adresi zaten kullanımda.")
+    db.expunge(new_user)
     db.commit()
-    db.refresh(new_user)
     return new_user
 
 @router.put("/{user_id}", response_model=schemas.User)
@@ -82,22 +99,34 @@ def update_user(
     """Kullanıcı güncelle"""
     check_admin_privileges(current_user)
     
-    # Kullanıcıyı bul
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
-        
-    # Tenant kontrolü (Başkabir tenantın kullanıcısını düzenlemeye çalışmasın)
-    if current_user.role != models.UserRole.SUPERADMIN and user.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=403, detail="Bu kullanıcıyı düzenleme yetkiniz yok")
-        
+    values = {}
     if user_update.full_name:
-        user.full_name = user_update.full_name
+        values["full_name"] = user_update.full_name
     if user_update.password:
-        user.hashed_password = hash_password(user_update.password)
-        
+        values["hashed_password"] = hash_password(user_update.password)
+    
+    # Tenant kontrolü (Başkabir tenantın kullanıcısını düzenlemeye çalışmasın)
+    # WHERE koşuluna eklenir; böylece tek UPDATE ... RETURNING yeterli olur
+    criteria = [models.User.id == user_id]
+    if current_user.role != models.UserRole.SUPERADMIN:
+        criteria.append(models.User.tenant_id == current_user.tenant_id)
+    
+    if values:
+        user = db.scalars(
+            update(models.User).where(*criteria).values(**values).returning(models.User)
+        ).first()
+    else:
+        user = db.query(models.User).filter(*criteria).first()
+    
+    if not user:
+        # Satır yoksa 404, başka tenanta aitse 403
+        exists = db.query(models.User.id).filter(models.User.id == user_id).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+        raise HTTPException(status_code=403, detail="Bu kullanıcıyı düzenleme yetkiniz yok")
+    
+    db.expunge(user)
     db.commit()
-    db.refresh(user)
     return user
 
 @router.delete("/{user_id}")
@@ -1,8 +1,14 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime, date
 from enum import Enum
 
+
+class ORMBase(BaseModel):
+    """ORM nesnelerinden okunan (from_attributes) şemalar için ortak taban"""
+    model_config = ConfigDict(from_attributes=True)
+
 # Enums
 class UserRole(str, Enum):
     SUPERADMIN = "superadmin"
@@ -161,12 +167,17 @@ class TenantUpdate(BaseModel):
     is_active: Optional[bool] = None
     settings: Optional[str] = None
 
-class Tenant(TenantBase):
+class Tenant(TenantBase, ORMBase):
     id: int
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+class TenantSummary(ORMBase):
+    """Tenant list row - settings blob excluded"""
+    id: int
+    name: str
+    slug: str
+    is_active: bool = True
+    created_at: datetime
 
 # Account
 class AccountBase(BaseModel):
@@ -195,23 +206,15 @@ class AccountBase(BaseModel):
 class AccountCreate(AccountBase):
     vtiger_id: Optional[str] = None  # CSV import için
 
-class Account(AccountBase):
+class Account(AccountBase, ORMBase):
     id: int
     vtiger_id: Optional[str] = None
     receivable_balance: float = 0.0
     payable_balance: float = 0.0
-    contacts: List['Contact'] = []  # İlgili kişiler
+    contacts: List['Contact'] = Field(default_factory=list)  # İlgili kişiler
     created_at: Optional[datetime] = None
     modified_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
-# Alias for backward compatibility
-CustomerBase = AccountBase
-CustomerCreate = AccountCreate
-Customer = Account
-
 # Product
 class ProductBase(BaseModel):
     name: str
@@ -227,12 +230,9 @@ class ProductBase(BaseModel):
 class ProductCreate(ProductBase):
     pass
 
-class Product(ProductBase):
+class Product(ProductBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
-
 # Deal
 class DealBase(BaseModel):
     title: str
@@ -254,7 +254,7 @@ class DealUpdate(BaseModel):
 class DealStatusUpdate(BaseModel):
     status: DealStatus
 
-class Deal(BaseModel):
+class Deal(ORMBase):
     id: int
     title: str
     source: Optional[str] = None
@@ -266,9 +266,6 @@ class Deal(BaseModel):
     created_at: datetime
     customer: Optional[Account] = None
 
-    class Config:
-        from_attributes = True
-
 # Quote Item
 class QuoteItemBase(BaseModel):
     product_id: Optional[int] = None
@@ -282,16 +279,16 @@ class QuoteItemBase(BaseModel):
 class QuoteItemCreate(QuoteItemBase):
     pass
 
-class QuoteItem(QuoteItemBase):
+class QuoteItemUpdate(QuoteItemBase):
+    id: Optional[int] = None  # Existing item id; omitted for newly added lines
+
+class QuoteItem(QuoteItemBase, ORMBase):
     id: int
     line_total: float
     vat_amount: float
     total_with_vat: float
     unit: str = "Adet"
     product: Optional[Product] = None
-    
-    class Config:
-        from_attributes = True
 
 class QuoteBase(BaseModel):
     deal_id: Optional[int] = None
@@ -319,9 +316,15 @@ class QuoteUpdate(BaseModel):
     currency: Optional[Currency] = None
     valid_until: Optional[datetime] = None
     notes: Optional[str] = None
-    items: List[QuoteItemCreate]
+    items: List[QuoteItemUpdate]
 
-class Quote(QuoteBase):
+class QuoteBulkPdfRequest(BaseModel):
+    """Toplu teklif PDF indirme"""
+    # Tek istek ortak PDF havuzunu tıkamasın ve ZIP bellekte makul boyutta kalsın
+    quote_ids: List[int] = Field(min_length=1, max_length=50)
+
+class QuoteRevision(QuoteBase, ORMBase):
+    """Kök teklifin revizyonu (revizyonlar her zaman kök teklife bağlanır, iç içe değildir)"""
     id: int
     version: int
     status: QuoteStatus
@@ -333,12 +336,11 @@ class Quote(QuoteBase):
     total_amount: float
     created_at: datetime
     updated_at: Optional[datetime] = None
-    items: List[QuoteItem] = []
+    items: List[QuoteItem] = Field(default_factory=list)
     account: Optional[Account] = None
-    revisions: List['Quote'] = []
 
-    class Config:
-        from_attributes = True
+class Quote(QuoteRevision):
+    revisions: List[QuoteRevision] = Field(default_factory=list)
 
 # Invoice Item
 class InvoiceItemBase(BaseModel):
@@ -356,7 +358,7 @@ class InvoiceItemBase(BaseModel):
 class InvoiceItemCreate(InvoiceItemBase):
     pass
 
-class InvoiceItem(InvoiceItemBase):
+class InvoiceItem(InvoiceItemBase, ORMBase):
     id: int
     line_total: float
     vat_amount: float
@@ -367,9 +369,6 @@ class InvoiceItem(InvoiceItemBase):
     exemption_code: Optional[str] = None
     original_vat_rate: Optional[int] = None
 
-    class Config:
-        from_attributes = True
-
 # Invoice
 class InvoiceBase(BaseModel):
     invoice_type: InvoiceType = InvoiceType.SALES
@@ -384,7 +383,7 @@ class InvoiceBase(BaseModel):
     expense_category: Optional[ExpenseCategory] = None
     is_project_expense: bool = False
     notes: Optional[str] = None
-    expense_center: Optional['ExpenseCenter'] = None
+    expense_center: Optional[ExpenseCenter] = None
 
 class InvoiceCreate(InvoiceBase):
     items: List[InvoiceItemCreate]
@@ -402,10 +401,10 @@ class InvoiceUpdate(BaseModel):
     expense_category: Optional[ExpenseCategory] = None
     is_project_expense: Optional[bool] = None
     notes: Optional[str] = None
-    expense_center: Optional['ExpenseCenter'] = None
+    expense_center: Optional[ExpenseCenter] = None
     items: Optional[List[InvoiceItemCreate]] = None
 
-class Invoice(InvoiceBase):
+class Invoice(InvoiceBase, ORMBase):
     id: int
     subtotal: float
     vat_amount: float
@@ -422,10 +421,7 @@ class Invoice(InvoiceBase):
     is_project_expense: bool = False
     notes: Optional[str] = None
     expense_center: Optional[ExpenseCenter] = None
-    items: List[InvoiceItem] = []
-
-    class Config:
-        from_attributes = True
+    items: List[InvoiceItem] = Field(default_factory=list)
 
 # Transaction
 class TransactionBase(BaseModel):
@@ -444,14 +440,13 @@ class TransactionBase(BaseModel):
 class TransactionCreate(TransactionBase):
     pass
 
-class Transaction(TransactionBase):
+class Transaction(TransactionBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
-
 # Dashboard KPIs
-class DashboardKPIs(BaseModel):
+# Sunucuda hesaplanıp döndürülen salt-okunur kaplar; doğrulamaya gerek yok
+@dataclass(slots=True)
+class DashboardKPIs:
     total_receivables: float
     total_payables: float
     monthly_sales: float
@@ -492,13 +487,10 @@ class ProjectUpdate(BaseModel):
     status: Optional[ProjectStatus] = None
     budget: Optional[float] = None
 
-class Project(ProjectBase):
+class Project(ProjectBase, ORMBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 class ProjectSummary(BaseModel):
     """Proje Finansal Özeti"""
     project: Project
@@ -522,15 +514,12 @@ class FinancialAccountUpdate(BaseModel):
     description: Optional[str] = None
     is_active: Optional[bool] = None
 
-class FinancialAccount(FinancialAccountBase):
+class FinancialAccount(FinancialAccountBase, ORMBase):
     id: int
     balance: float
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 class TransferRequest(BaseModel):
     """Hesaplar arası virman"""
     source_account_id: int
@@ -583,15 +572,12 @@ class ContactUpdate(BaseModel):
     email_opt_out: Optional[bool] = None
     description: Optional[str] = None
 
-class Contact(ContactBase):
+class Contact(ContactBase, ORMBase):
     id: int
     vtiger_id: Optional[str] = None
     created_at: datetime
     modified_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 # Activity
 class ActivityBase(BaseModel):
     activity_type: ActivityType = ActivityType.NOTE
@@ -604,13 +590,10 @@ class ActivityBase(BaseModel):
 class ActivityCreate(ActivityBase):
     pass
 
-class Activity(ActivityBase):
+class Activity(ActivityBase, ORMBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 # User & Authentication
 class UserBase(BaseModel):
     email: str
@@ -624,15 +607,12 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     password: Optional[str] = None
 
-class User(UserBase):
+class User(UserBase, ORMBase):
     id: int
     is_active: bool
     is_superuser: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 class UserWithTenant(User):
     tenant_id: Optional[int] = None
     tenant: Optional[Tenant] = None
@@ -694,14 +674,13 @@ class EmployeeUpdate(BaseModel):
     gross_salary: Optional[float] = None
 
 
-class EmployeeResponse(EmployeeBase):
+class EmployeeResponse(EmployeeBase, ORMBase):
     id: int
+    # Kayıtlı e-postalar yazılırken doğrulandı; okumada email-validator tekrar çalışmasın
+    email: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class PayrollPeriodBase(BaseModel):
     year: int
@@ -713,13 +692,10 @@ class PayrollPeriodCreate(PayrollPeriodBase):
     pass
 
 
-class PayrollPeriodResponse(PayrollPeriodBase):
+class PayrollPeriodResponse(PayrollPeriodBase, ORMBase):
     id: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class PayrollEntryInput(BaseModel):
     employee_id: int
@@ -735,7 +711,7 @@ class PayrollEntryInput(BaseModel):
     total_minutes: int = 0
 
 
-class PayrollEntryResponse(BaseModel):
+class PayrollEntryResponse(ORMBase):
     id: int
     employee_id: int
     payroll_period_id: int
@@ -757,9 +733,6 @@ class PayrollEntryResponse(BaseModel):
     stamp_tax_exemption_amount: float
     sgk_employer_incentive_amount: float
 
-    class Config:
-        from_attributes = True
-
 
 class PayrollProcessRequest(BaseModel):
     entries: List[PayrollEntryInput]
@@ -863,7 +836,7 @@ class ParsedInvoice(BaseModel):
     
     # Verification
     verification_status: Optional[str] = None
-    verification_notes: List[str] = []
+    verification_notes: List[str] = Field(default_factory=list)
     
     # Classification
     invoice_type: InvoiceType = InvoiceType.PURCHASE
@@ -873,8 +846,8 @@ class ParsedInvoice(BaseModel):
     vat_exempt: bool = False
     
     # Data
-    lines: List[ParsedInvoiceLine] = []
-    notes: List[str] = []
+    lines: List[ParsedInvoiceLine] = Field(default_factory=list)
+    notes: List[str] = Field(default_factory=list)
     raw_text: Optional[str] = None
 
 
@@ -890,11 +863,8 @@ class SystemSettingUpdate(BaseModel):
     value: str
     description: Optional[str] = None
 
-class SystemSetting(SystemSettingBase):
+class SystemSetting(SystemSettingBase, ORMBase):
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # ==================== EXEMPTION REPORT SCHEMAS ====================
@@ -928,7 +898,7 @@ class ExemptionReportCreate(ExemptionReportBase):
     pass
 
 
-class ExemptionReport(ExemptionReportBase):
+class ExemptionReport(ExemptionReportBase, ORMBase):
     id: int
     tenant_id: Optional[int] = None
     file_path: Optional[str] = None
@@ -936,9 +906,6 @@ class ExemptionReport(ExemptionReportBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 # ==================== TECHNOPARK OFFICIAL REPORT SCHEMAS ====================
 
@@ -1007,10 +974,10 @@ class TechnoparkReportBase(BaseModel):
 
 
 class TechnoparkReportCreate(TechnoparkReportBase):
-    project_entries: List[TechnoparkProjectEntryBase] = []
-    project_progress_entries: List[TechnoparkProjectProgressBase] = []
-    personnel_entries: List[TechnoparkPersonnelEntryBase] = []
-    line_items: List[TechnoparkReportLineItemBase] = []
+    project_entries: List[TechnoparkProjectEntryBase] = Field(default_factory=list)
+    project_progress_entries: List[TechnoparkProjectProgressBase] = Field(default_factory=list)
+    personnel_entries: List[TechnoparkPersonnelEntryBase] = Field(default_factory=list)
+    line_items: List[TechnoparkReportLineItemBase] = Field(default_factory=list)
 
 
 class TechnoparkReportUpdate(BaseModel):
@@ -1025,47 +992,32 @@ class TechnoparkReportUpdate(BaseModel):
     line_items: Optional[List[TechnoparkReportLineItemBase]] = None
 
 
-class TechnoparkProjectEntry(TechnoparkProjectEntryBase):
+class TechnoparkProjectEntry(TechnoparkProjectEntryBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
-
 
-class TechnoparkProjectProgress(TechnoparkProjectProgressBase):
+class TechnoparkProjectProgress(TechnoparkProjectProgressBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
 
-
-class TechnoparkPersonnelEntry(TechnoparkPersonnelEntryBase):
+class TechnoparkPersonnelEntry(TechnoparkPersonnelEntryBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
-
 
-class TechnoparkReportLineItem(TechnoparkReportLineItemBase):
+class TechnoparkReportLineItem(TechnoparkReportLineItemBase, ORMBase):
     id: int
 
-    class Config:
-        from_attributes = True
 
-
-class TechnoparkReport(TechnoparkReportBase):
+class TechnoparkReport(TechnoparkReportBase, ORMBase):
     id: int
     tenant_id: Optional[int] = None
-    project_entries: List[TechnoparkProjectEntry] = []
-    project_progress_entries: List[TechnoparkProjectProgress] = []
-    personnel_entries: List[TechnoparkPersonnelEntry] = []
-    line_items: List[TechnoparkReportLineItem] = []
+    project_entries: List[TechnoparkProjectEntry] = Field(default_factory=list)
+    project_progress_entries: List[TechnoparkProjectProgress] = Field(default_factory=list)
+    personnel_entries: List[TechnoparkPersonnelEntry] = Field(default_factory=list)
+    line_items: List[TechnoparkReportLineItem] = Field(default_factory=list)
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 # ==================== TAX PARAMETERS SCHEMAS ====================
 
@@ -1086,7 +1038,7 @@ class TaxParameters2026(BaseModel):
     venture_capital_max_amount: float = 100000000.0  # 100M TL üst sınır
     remote_work_rate_informatics: float = 1.0  # Bilişim personeli %100
     remote_work_rate_other: float = 0.75  # Diğer personel %75
-    income_tax_exemptions: IncomeTaxExemptions = IncomeTaxExemptions()
+    income_tax_exemptions: IncomeTaxExemptions = Field(default_factory=IncomeTaxExemptions)
     corporate_tax_rate: float = 0.25  # Kurumlar Vergisi %25
     vat_rate: float = 0.20  # KDV %20
     daily_food_exemption: float = 300.0  # Günlük yemek muafiyeti
@@ -1163,3 +1115,13 @@ class YearlyTaxSummary(BaseModel):
     total_venture_capital_obligation: float
     total_tax_advantage: float
 
+
+
+# ==================== FORWARD REFERENCES ====================
+
+# Account -> Contact ileriye dönük referansı çözülsün; aksi halde bu modeller
+# (ve onları içeren Deal/Quote) ilk istekte derlenir
+Account.model_rebuild()
+Deal.model_rebuild()
+QuoteRevision.model_rebuild()
+Quote.model_rebuild()
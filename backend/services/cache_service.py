@@ -0,0 +1,49 @@
+"""
+Süreç içi TTL önbelleği
+
+Nadiren değişen ya da hesaplaması pahalı sonuçlar için kullanılır. Her worker
+süreci kendi kopyasını tutar; TTL, diğer worker'lardaki güncellemelerin ne
+kadar gecikmeyle görüneceğinin üst sınırıdır. Senkron endpoint'ler
+Starlette'in thread havuzunda çalıştığından erişim bir kilitle korunur.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Anahtar başına son kullanma süresi olan basit sözlük önbelleği"""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Süresi dolmamış değeri döndür, yoksa None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                self._entries.pop(key, None)
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                # En eski kaydı at (dict ekleme sırasını korur)
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Tek bir anahtarı ya da (key=None ise) tüm önbelleği temizle"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -12,12 +12,22 @@ Heuristics:
 - Teknokent: "Kuluçka" veya "Teknoloji Geliştirme Bölgesi" keywords
 """
 import re
-import io
+import asyncio
+import hashlib
 from datetime import date, datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, BinaryIO
 from fastapi import UploadFile
 import pdfplumber
 
+from .cache_service import TTLCache
+
+# Extracted pages keyed by the PDF's content digest; retried or re-uploaded
+# invoices skip pdfplumber entirely
+PAGE_CACHE = TTLCache(ttl_seconds=600, maxsize=32)
+
+# Block size for hashing the uploaded file
+DIGEST_CHUNK_SIZE = 1 << 16
+
 
 # Regex patterns for Turkish e-invoices
 ETTN_PATTERN = re.compile(
@@ -31,11 +41,47 @@ PROJECT_CODE_PATTERN = re.compile(r'Proje\s*Kodu\s*:?\s*(\d+)', re.IGNORECASE)
 VKN_PATTERN = re.compile(r'(?:VKN|V\.K\.N|Vergi\s*(?:Kimlik)?\s*No?(?:mrası)?)[:\s]*([0-9]{10,11})', re.IGNORECASE)
 VKN_STANDALONE = re.compile(r'\b([0-9]{10,11})\b')
 
+VKN_LABEL_PATTERN = re.compile(r'VKN:\s*(\d{10,11})')
+
 # Vergi Dairesi
 TAX_OFFICE_PATTERN = re.compile(
     r'(?:Vergi\s*Dairesi|V\.D)[:\s]*([\wçğıöşüÇĞİÖŞÜ\s]+?)(?:\n|\d|VKN|Vergi|$)',
     re.IGNORECASE | re.UNICODE
 )
+TAX_OFFICE_SUFFIX_PATTERN = re.compile(r'\s+V\.?D\.?S?\.?M?\.?$', re.IGNORECASE)
+CUSTOMER_TAX_OFFICE_PATTERN = re.compile(
+    r'Vergi\s*Dairesi:\s*([\wçğıöşüÇĞİÖŞÜ\s]+?)(?:\n|ETTN|$)', re.IGNORECASE
+)
+
+# Customer (SAYIN) section, up to the line items table or the invoice metadata
+CUSTOMER_SECTION_PATTERN = re.compile(
+    r'SAYIN\s*\n?(.+?)(?=Stok\s*Kodu|İskonto|Sıra\s*No)', re.DOTALL | re.IGNORECASE
+)
+CUSTOMER_SECTION_FALLBACK_PATTERN = re.compile(
+    r'SAYIN\s*\n?(.+?)(?=Senaryo|Fatura Tipi|Fatura No)', re.DOTALL | re.IGNORECASE
+)
+SAYIN_LINE_PATTERN = re.compile(r'sayın\s*:?\s*([^\n]+)', re.IGNORECASE)
+
+COMPANY_NAME_PATTERN = re.compile(
+    r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:A\.?Ş\.?|LTD\.?|Ltd\.?\s*Şti\.?))',
+    re.UNICODE
+)
+
+# Totals block of the invoice text: (pattern, result key)
+TOTALS_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), key)
+    for pattern, key in (
+        (r'Mal\s*Hizmet\s*Toplam\s*Tutarı?\s*([\d.,]+)\s*TL', 'gross_total'),
+        (r'Toplam\s*[İI]skonto\s*([\d.,]+)\s*TL', 'total_discount'),
+        (r'KDV.*?siz\s*Net\s*Tutar\s*([\d.,]+)\s*TL', 'net_subtotal'),
+        (r'Hesaplanan\s*(?:GERÇEK\s*USULDE\s*)?(?:KATMA\s*DEĞER\s*VERGİSİ|KDV).*?([\d.,]+)\s*TL', 'vat_amount'),
+        (r'KDV\s*Dahil\s*Toplam\s*Tutar\s*([\d.,]+)\s*TL', 'grand_total'),
+        (r'(?:Vergiler\s*[Dd]ahil\s*Toplam\s*Tutar|Ödenecek\s*Tutar)\s*([\d.,]+)\s*TL', 'payable'),
+    )
+)
+
+# Table cell values
+INTEGER_PATTERN = re.compile(r'(\d+)')
 
 # Keywords for amount detection
 AMOUNT_KEYWORDS = [
@@ -65,6 +111,23 @@ TECHNOPARK_KEYWORDS = [
     'tgb',
 ]
 
+# Turkish letters → ASCII equivalents, used by _normalize_turkish
+TURKISH_REPLACEMENTS = (
+    ('ı', 'i'),  # Turkish dotless i
+    ('i̇', 'i'),  # i with combining dot above (from İ)
+    ('ş', 's'),
+    ('ğ', 'g'),
+    ('ü', 'u'),
+    ('ö', 'o'),
+    ('ç', 'c'),
+    ('İ', 'i'),
+    ('Ş', 's'),
+    ('Ğ', 'g'),
+    ('Ü', 'u'),
+    ('Ö', 'o'),
+    ('Ç', 'c'),
+)
+
 # Company name for direction detection
 OUR_COMPANY = 'pikolab'
 
@@ -86,23 +149,10 @@ def _normalize_turkish(text: str) -> str:
     Handles: İ→i, I→ı (but we use lowercase), Ş→s, Ğ→g, Ü→u, Ö→o, Ç→c
     Also handles combining characters from uppercase Turkish letters.
     """
-    # Replace Turkish lowercase characters with ASCII equivalents
-    replacements = {
-        'ı': 'i',  # Turkish dotless i
-        'i̇': 'i',  # i with combining dot above (from İ)
-        'ş': 's',
-        'ğ': 'g', 
-        'ü': 'u',
-        'ö': 'o',
-        'ç': 'c',
-        'İ': 'i',
-        'Ş': 's',
-        'Ğ': 'g',
-        'Ü': 'u',
-        'Ö': 'o',
-        'Ç': 'c',
-    }
-    for tr_char, ascii_char in replacements.items():
+    # Most header cells are plain ASCII ("miktar", "tutar"); nothing to replace
+    if text.isascii():
+        return text
+    for tr_char, ascii_char in TURKISH_REPLACEMENTS:
         text = text.replace(tr_char, ascii_char)
     return text
 
@@ -120,7 +170,8 @@ def _extract_issuer_info(text: str) -> Dict[str, Optional[str]]:
         'issuer_tax_office': None
     }
     
-    lines = text.split('\n')
+    # Only the header is inspected; stop splitting after the first 30 lines
+    lines = text.split('\n', 30)
     
     # First line is usually issuer name
     if lines:
@@ -137,12 +188,13 @@ def _extract_issuer_info(text: str) -> Dict[str, Optional[str]]:
             if len(parts) > 1:
                 result['issuer_tax_office'] = parts[1].strip()
         elif 'VKN:' in line:
-            match = re.search(r'VKN:\s*(\d{10,11})', line)
+            match = VKN_LABEL_PATTERN.search(line)
             if match:
                 result['issuer_tax_id'] = match.group(1)
-        elif line_stripped and 'http' not in line.lower() and 'sicil' not in line.lower() \
-                and 'mersis' not in line.lower() and not line_stripped.startswith('Web'):
-            addr_lines.append(line_stripped)
+        elif line_stripped and not line_stripped.startswith('Web'):
+            line_lower = line.lower()
+            if 'http' not in line_lower and 'sicil' not in line_lower and 'mersis' not in line_lower:
+                addr_lines.append(line_stripped)
     
     if addr_lines:
         result['issuer_address'] = ' '.join(addr_lines)
@@ -164,10 +216,10 @@ def _extract_customer_info(text: str) -> Dict[str, Optional[str]]:
     }
     
     # Find the SAYIN section - extend the search area
-    sayin_match = re.search(r'SAYIN\s*\n?(.+?)(?=Stok\s*Kodu|İskonto|Sıra\s*No)', text, re.DOTALL | re.IGNORECASE)
+    sayin_match = CUSTOMER_SECTION_PATTERN.search(text)
     if not sayin_match:
         # Try alternative pattern
-        sayin_match = re.search(r'SAYIN\s*\n?(.+?)(?=Senaryo|Fatura Tipi|Fatura No)', text, re.DOTALL | re.IGNORECASE)
+        sayin_match = CUSTOMER_SECTION_FALLBACK_PATTERN.search(text)
     
     if not sayin_match:
         return result
@@ -185,12 +237,12 @@ def _extract_customer_info(text: str) -> Dict[str, Optional[str]]:
     
     # Find VKN and Vergi Dairesi in the customer section
     # All VKNs in customer section
-    all_vkns = re.findall(r'VKN:\s*(\d{10,11})', customer_text)
+    all_vkns = VKN_LABEL_PATTERN.findall(customer_text)
     if all_vkns:
         result['customer_tax_id'] = all_vkns[-1]  # Last VKN in customer section is usually the customer's
     
     # Find Vergi Dairesi
-    vd_match = re.search(r'Vergi\s*Dairesi:\s*([\wçğıöşüÇĞİÖŞÜ\s]+?)(?:\n|ETTN|$)', customer_text, re.IGNORECASE)
+    vd_match = CUSTOMER_TAX_OFFICE_PATTERN.search(customer_text)
     if vd_match:
         result['customer_tax_office'] = vd_match.group(1).strip()
     
@@ -223,17 +275,8 @@ def _extract_totals_from_text(text: str) -> Dict[str, Optional[float]]:
         'payable': None           # Ödenecek Tutar
     }
     
-    patterns = [
-        (r'Mal\s*Hizmet\s*Toplam\s*Tutarı?\s*([\d.,]+)\s*TL', 'gross_total'),
-        (r'Toplam\s*[İI]skonto\s*([\d.,]+)\s*TL', 'total_discount'),
-        (r'KDV.*?siz\s*Net\s*Tutar\s*([\d.,]+)\s*TL', 'net_subtotal'),
-        (r'Hesaplanan\s*(?:GERÇEK\s*USULDE\s*)?(?:KATMA\s*DEĞER\s*VERGİSİ|KDV).*?([\d.,]+)\s*TL', 'vat_amount'),
-        (r'KDV\s*Dahil\s*Toplam\s*Tutar\s*([\d.,]+)\s*TL', 'grand_total'),
-        (r'(?:Vergiler\s*[Dd]ahil\s*Toplam\s*Tutar|Ödenecek\s*Tutar)\s*([\d.,]+)\s*TL', 'payable'),
-    ]
-    
-    for pattern, key in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, key in TOTALS_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
                 value_str = match.group(1).replace('.', '').replace(',', '.')
@@ -294,6 +337,22 @@ def _verify_totals(line_items: List[Dict], extracted_totals: Dict) -> Tuple[str,
     return status, notes
 
 
+def _digest_stream(stream: BinaryIO) -> str:
+    """Hash the whole stream and rewind it (blocking)."""
+    digest = hashlib.blake2b(digest_size=16)
+    stream.seek(0)
+    while chunk := stream.read(DIGEST_CHUNK_SIZE):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _extract_pages(stream: BinaryIO) -> List[Tuple[str, List[List[List]]]]:
+    """Read each page's text and tables, in page order (blocking)."""
+    with pdfplumber.open(stream) as pdf:
+        return [(page.extract_text() or "", page.extract_tables()) for page in pdf.pages]
+
+
 async def parse_invoice_pdf(file: UploadFile, invoice_type: str = "Purchase") -> Dict[str, Any]:
     """
     Parse a PDF invoice file and extract structured data.
@@ -321,52 +380,58 @@ async def parse_invoice_pdf(file: UploadFile, invoice_type: str = "Purchase") ->
     invoice_no = None
     invoice_date_str = None
 
-    # Read PDF content
-    content = await file.read()
-
-    # Extract text from all pages
-    full_text = ""
-    with pdfplumber.open(io.BytesIO(content)) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            full_text += page_text + "\n"
-
-            # Extract and classify all tables
-            tables = page.extract_tables()
-            for table in tables:
-                if not table or len(table) < 1:
-                    continue
-                
-                table_type = _classify_table(table)
-                
-                if table_type == 'metadata':
-                    # Extract invoice number and date from metadata table
-                    for row in table:
-                        if len(row) >= 2:
-                            label = str(row[0] or '').lower().strip()
-                            value = str(row[1] or '').strip()
-                            if 'fatura no' in label:
-                                invoice_no = value
-                            elif 'fatura tarihi' in label:
-                                invoice_date_str = value
-                
-                elif table_type == 'line_items':
-                    # Parse line items from this table
-                    lines.extend(_parse_line_items_table(table))
-                
-                elif table_type == 'totals':
-                    # Extract totals for verification
-                    _extract_totals(table, parsed_totals)
-                
-                elif table_type == 'notes':
-                    # Extract notes from the notes table
-                    for row in table:
-                        for cell in row:
-                            if cell:
-                                text = str(cell).strip()
-                                if text and len(text) > 3:
-                                    invoice_notes.append(text)
-
+    # The upload is already spooled (memory, or disk when large); pdfplumber
+    # reads it in place instead of from a second in-memory copy
+    digest = await asyncio.to_thread(_digest_stream, file.file)
+
+    # Pages are only read below, so cached ones are shared as-is
+    pages = PAGE_CACHE.get(digest)
+    if pages is None:
+        # pdfminer is pure Python and CPU-bound; keep it off the event loop
+        pages = await asyncio.to_thread(_extract_pages, file.file)
+        PAGE_CACHE.set(digest, pages)
+
+    # Page texts are joined once after the loop
+    page_texts: List[str] = []
+    for page_text, tables in pages:
+        page_texts.append(page_text + "\n")
+
+        # Classify all tables
+        for table in tables:
+            if not table or len(table) < 1:
+                continue
+            
+            table_type = _classify_table(table)
+            
+            if table_type == 'metadata':
+                # Extract invoice number and date from metadata table
+                for row in table:
+                    if len(row) >= 2:
+                        label = str(row[0] or '').lower().strip()
+                        value = str(row[1] or '').strip()
+                        if 'fatura no' in label:
+                            invoice_no = value
+                        elif 'fatura tarihi' in label:
+                            invoice_date_str = value
+            
+            elif table_type == 'line_items':
+                # Parse line items from this table
+                lines.extend(_parse_line_items_table(table))
+            
+            elif table_type == 'totals':
+                # Extract totals for verification
+                _extract_totals(table, parsed_totals)
+            
+            elif table_type == 'notes':
+                # Extract notes from the notes table
+                for row in table:
+                    for cell in row:
+                        if cell:
+                            text = str(cell).strip()
+                            if text and len(text) > 3:
+                                invoice_notes.append(text)
+
+    full_text = "".join(page_texts)
     text_lower = full_text.lower()
 
     # Extract ETTN
@@ -380,7 +445,7 @@ async def parse_invoice_pdf(file: UploadFile, invoice_type: str = "Purchase") ->
         notes.append(f"Fatura No: {invoice_no}")
 
     # Extract date
-    issue_date = _extract_date(full_text)
+    issue_date = _extract_date(full_text, text_lower)
     if issue_date:
         notes.append(f"Fatura tarihi: {issue_date.strftime('%d.%m.%Y')}")
 
@@ -410,7 +475,7 @@ async def parse_invoice_pdf(file: UploadFile, invoice_type: str = "Purchase") ->
 
     # Determine invoice type (SALES vs PURCHASE)
     # Note: We use the passed-in invoice_type, but get supplier/receiver names from auto-detection
-    _detected_type, supplier_name, receiver_name = _determine_invoice_direction(full_text)
+    _detected_type, supplier_name, receiver_name = _determine_invoice_direction(full_text, text_lower)
     notes.append(f"Fatura tipi: {invoice_type}")
     
     # Use extracted names if available
@@ -512,14 +577,14 @@ def _classify_table(table: List[List]) -> str:
     first_row = [str(cell or '').lower().strip() for cell in table[0]]
     first_row_text = ' '.join(first_row)
     
-    # Check all rows for pattern matching
-    all_text = ' '.join(' '.join(str(c or '').lower() for c in row) for row in table)
-    
     # Line items table: has header with "ürün", "hizmet", "miktar", "birim fiyat"
     line_item_indicators = ['ürün', 'hizmet', 'miktar', 'birim', 'sıra']
     if sum(1 for ind in line_item_indicators if ind in first_row_text) >= 2:
         return 'line_items'
     
+    # Check all rows for pattern matching (only needed once the header check missed)
+    all_text = ' '.join(' '.join(str(c or '').lower() for c in row) for row in table)
+    
     # Metadata table: has "fatura no", "fatura tipi", "senaryo"
     metadata_indicators = ['fatura no', 'fatura tipi', 'senaryo', 'özelleştirme']
     if any(ind in all_text for ind in metadata_indicators):
@@ -534,11 +599,6 @@ def _classify_table(table: List[List]) -> str:
     if len(table) >= 1:
         # Check if it's mostly text (not key-value pairs like metadata)
         has_single_col = all(len(row) == 1 or sum(1 for c in row if c) <= 1 for row in table)
-        has_no_numbers = not any(
-            _parse_number(str(c or '')) is not None 
-            for row in table for c in row 
-            if c and 'tl' not in str(c).lower()
-        )
         if has_single_col and len(table) >= 2:
             return 'notes'
     
@@ -580,7 +640,7 @@ def _parse_line_items_table(table: List[List]) -> List[Dict[str, Any]]:
         elif 'miktar' in header:
             col_map['quantity'] = i
         # Unit price: "Birim Fiyat"
-        elif 'birim fiyat' in header or ('birim' in header and 'fiyat' in header):
+        elif 'birim' in header and 'fiyat' in header:
             col_map['unit_price'] = i
         # Discount rate: "İskonto Oranı"
         elif 'iskonto orani' in header:
@@ -591,7 +651,7 @@ def _parse_line_items_table(table: List[List]) -> List[Dict[str, Any]]:
         # Total: "Tutar" or "Mal Hizmet Tutarı"
         elif 'mal hizmet tutari' in header:
             col_map['total'] = i
-        elif header == 'tutar' or (header.startswith('tutar') and 'kdv' not in header and 'iskonto' not in header):
+        elif header.startswith('tutar') and 'kdv' not in header and 'iskonto' not in header:
             col_map['total'] = i
         # VAT rate: "KDV Oranı"
         elif 'kdv orani' in header:
@@ -630,9 +690,9 @@ def _parse_line_items_table(table: List[List]) -> List[Dict[str, Any]]:
         if col_map['quantity'] is not None and col_map['quantity'] < len(row):
             qty_raw = str(row[col_map['quantity']] or '')
             # Extract just the number part (before any text like "Adet")
-            qty_match = re.search(r'([\d.,]+)', qty_raw)
+            qty_match = AMOUNT_PATTERN.search(qty_raw)
             if qty_match:
-                qty = _parse_number(qty_match.group(1))
+                qty = _parse_number(qty_match.group(0))
                 if qty is not None:
                     line['quantity'] = qty
         
@@ -652,7 +712,7 @@ def _parse_line_items_table(table: List[List]) -> List[Dict[str, Any]]:
         if col_map['discount_rate'] is not None and col_map['discount_rate'] < len(row):
             discount_str = str(row[col_map['discount_rate']] or '')
             # Extract number from e.g., "%20,00" or "20"
-            discount_num = re.search(r'(\d+)', discount_str.replace(',', '.'))
+            discount_num = INTEGER_PATTERN.search(discount_str.replace(',', '.'))
             if discount_num:
                 line['discount_rate'] = int(discount_num.group(1))
         
@@ -666,7 +726,7 @@ def _parse_line_items_table(table: List[List]) -> List[Dict[str, Any]]:
         if col_map['vat_rate'] is not None and col_map['vat_rate'] < len(row):
             vat_str = str(row[col_map['vat_rate']] or '')
             # Extract number from e.g., "%20,00" or "20"
-            vat_num = re.search(r'(\d+)', vat_str.replace(',', '.'))
+            vat_num = INTEGER_PATTERN.search(vat_str.replace(',', '.'))
             if vat_num:
                 line['vat_rate'] = int(vat_num.group(1))
         
@@ -721,8 +781,9 @@ def _parse_turkish_currency(value: Any) -> Optional[float]:
         return None
     try:
         text = str(value).strip()
-        # Remove TL suffix and any whitespace
-        text = re.sub(r'\s*TL\s*$', '', text, flags=re.IGNORECASE)
+        # Remove TL suffix and any whitespace (plain slice; no regex per cell)
+        if text[-2:].lower() == 'tl':
+            text = text[:-2].rstrip()
         # Handle Turkish format: 1.234,56 (dots for thousands, comma for decimal)
         text = text.replace('.', '').replace(',', '.')
         return float(text) if text else None
@@ -736,11 +797,12 @@ def _extract_ettn(text: str) -> Optional[str]:
     return match.group(0) if match else None
 
 
-def _extract_date(text: str) -> Optional[date]:
-    """Extract invoice date from text."""
+def _extract_date(text: str, text_lower: Optional[str] = None) -> Optional[date]:
+    """Extract invoice date from text (text_lower: already lowercased text, if the caller has it)."""
     # Look for date near keywords first
     date_keywords = ['fatura tarihi', 'düzenleme tarihi', 'tarih']
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
     for keyword in date_keywords:
         idx = text_lower.find(keyword)
@@ -774,7 +836,7 @@ def _extract_amount(text_lower: str, keywords: List[str]) -> Optional[float]:
             # Search for number after keyword
             context = text_lower[idx:idx + 100]
             # Find all number-like patterns
-            numbers = re.findall(r'[\d.,]+', context)
+            numbers = AMOUNT_PATTERN.findall(context)
             for num_str in numbers:
                 try:
                     # Handle Turkish number format (1.234,56)
@@ -788,7 +850,7 @@ def _extract_amount(text_lower: str, keywords: List[str]) -> Optional[float]:
 
 
 def _determine_invoice_direction(
-    text: str,
+    text: str, text_lower: Optional[str] = None
 ) -> tuple[str, Optional[str], Optional[str]]:
     """
     Determine if invoice is SALES or PURCHASE based on parties.
@@ -796,12 +858,11 @@ def _determine_invoice_direction(
     Returns:
         Tuple of (invoice_type, supplier_name, receiver_name)
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
     # Look for "SAYIN:" pattern to find receiver
-    sayin_match = re.search(
-        r'sayın\s*:?\s*([^\n]+)', text_lower, re.IGNORECASE
-    )
+    sayin_match = SAYIN_LINE_PATTERN.search(text_lower)
     receiver_context = sayin_match.group(1) if sayin_match else ""
 
     # If receiver contains our company name, it's a PURCHASE (we received it)
@@ -826,11 +887,7 @@ def _extract_company_name(
 ) -> Optional[str]:
     """Extract company name from invoice header."""
     # Look for common Turkish company suffixes
-    company_pattern = re.compile(
-        r'([A-ZÇĞİÖŞÜa-zçğıöşü\s]+(?:A\.?Ş\.?|LTD\.?|Ltd\.?\s*Şti\.?))',
-        re.UNICODE
-    )
-    matches = company_pattern.findall(text[:1000])
+    matches = COMPANY_NAME_PATTERN.findall(text[:1000])
 
     for match in matches:
         clean = match.strip()
@@ -844,9 +901,7 @@ def _extract_company_name(
 
 def _extract_receiver_name(text: str) -> Optional[str]:
     """Extract receiver name from SAYIN: section."""
-    sayin_match = re.search(
-        r'sayın\s*:?\s*([^\n]+)', text, re.IGNORECASE
-    )
+    sayin_match = SAYIN_LINE_PATTERN.search(text)
     if sayin_match:
         return sayin_match.group(1).strip()[:100]
     return None
@@ -1024,7 +1079,7 @@ def _parse_table_lines(table: List[List]) -> List[Dict[str, Any]]:
         # Extract VAT rate
         if vat_idx is not None and vat_idx < len(row):
             vat_str = str(row[vat_idx] or '')
-            vat_num = re.search(r'(\d+)', vat_str)
+            vat_num = INTEGER_PATTERN.search(vat_str)
             if vat_num:
                 line['vat_rate'] = int(vat_num.group(1))
         
@@ -1082,7 +1137,7 @@ def _extract_tax_office(text: str) -> Optional[str]:
     if match:
         office = match.group(1).strip()
         # Clean up common suffixes
-        office = re.sub(r'\s+V\.?D\.?S?\.?M?\.?$', '', office, flags=re.IGNORECASE)
+        office = TAX_OFFICE_SUFFIX_PATTERN.sub('', office)
         return office.strip()[:100] if office else None
     return None
 
@@ -1,9 +1,9 @@
-import json
 from typing import Dict, Any
 
 from sqlalchemy.orm import Session
 
 from .. import models
+from .. import json_utils
 
 
 DEFAULT_TECHNOPARK_LEGAL_BASIS: Dict[str, Any] = {
@@ -51,7 +51,7 @@ class LegalBasisService:
 
         if setting and setting.value:
             try:
-                return json.loads(setting.value)
+                return json_utils.loads(setting.value)
             except Exception:
                 pass
 
@@ -65,11 +65,11 @@ class LegalBasisService:
             models.SystemSetting.key == "technopark_legal_basis"
         ).first()
         if setting:
-            setting.value = json.dumps(current)
+            setting.value = json_utils.dumps(current)
         else:
             setting = models.SystemSetting(
                 key="technopark_legal_basis",
-                value=json.dumps(current),
+                value=json_utils.dumps(current),
                 description="Teknokent yasal dayanak sözlüğü",
             )
             self.db.add(setting)
@@ -4,12 +4,12 @@ Teknokent Personel & Bordro Yönetimi Servisi
 """
 
 from typing import Dict, Any, List, Optional
-import json
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from .. import json_utils
 
 
 class PayrollService:
@@ -111,7 +111,7 @@ class PayrollService:
 
         if setting and setting.value:
             try:
-                brackets = json.loads(setting.value)
+                brackets = json_utils.loads(setting.value)
                 if isinstance(brackets, list):
                     return brackets
             except Exception:
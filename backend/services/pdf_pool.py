@@ -0,0 +1,74 @@
+"""
+PDF render süreç havuzu
+
+ReportLab çizimi CPU-bound saf Python'dur; eşzamanlı PDF indirmeleri GIL'de
+sıraya girmesin diye ayrı süreçlerde çalıştırılır. Havuz nesnesi uygulama
+açılışında kurulur, kapanışta durdurulur; worker süreçleri ilk işte başlar.
+Worker'lar fork değil spawn ile başlatılır: çok thread'li sunucuda başka bir
+thread'in tuttuğu kilitler (logging, bağlantı havuzu) yeni sürece kopyalanmaz.
+Bir worker ölürse (OOM, segfault) havuz kalıcı olarak bozulur; bu durumda
+sonraki istekler için yenisi kurulur.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# Her uvicorn worker'ı kendi havuzunu kurar; toplam süreç sayısı
+# uvicorn worker sayısı × PDF_WORKERS olur, bu yüzden varsayılan küçük tutulur
+PDF_WORKERS = int(os.getenv("PDF_WORKERS") or 2)
+
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _new_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=_SPAWN_CONTEXT)
+
+
+def start_pdf_pool() -> ProcessPoolExecutor:
+    """Havuzu döndür, yoksa kur"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _new_pool()
+        return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Havuzu durdur (bekleyen işler iptal edilir)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        # Eşzamanlı istekler aynı bozuk havuzu görebilir; yalnızca biri değiştirir
+        if _pool is broken:
+            _pool = _new_pool()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_pdf_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """func(*args)'ı havuzda çalıştır.
+
+    Havuz bozulursa sonraki istekler için yenisi kurulur ama iş tekrar
+    denenmez: worker'ı düşüren bir iş yeni havuzu da düşürüp diğer
+    kullanıcıların işlerini yeniden bozardı. BrokenProcessPool çağırana iletilir.
+    """
+    pool = start_pdf_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _replace_broken_pool(pool)
+        raise
@@ -30,6 +30,7 @@ from sqlalchemy import extract
 
 from .. import models, schemas
 from .tax_service import TaxService
+from .tenant_settings_service import get_tenant_settings
 
 
 class ReportingService:
@@ -42,6 +43,8 @@ class ReportingService:
     
     def _register_fonts(self):
         """Türkçe karakter desteği için font kayıt"""
+        if 'DejaVuSans' in pdfmetrics.getRegisteredFontNames():
+            return  # TTFs are parsed once per process
         font_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts')
         try:
             if os.path.exists(os.path.join(font_dir, 'DejaVuSans.ttf')):
@@ -404,16 +407,9 @@ class ReportingService:
     def _get_company_info(self, tenant_id: Optional[int]) -> Dict[str, Any]:
         """Firma bilgilerini al"""
         if tenant_id:
-            tenant = self.db.query(models.Tenant).filter(
-                models.Tenant.id == tenant_id
-            ).first()
-            
-            if tenant and tenant.settings:
-                try:
-                    import json
-                    return json.loads(tenant.settings)
-                except Exception:
-                    pass
+            settings = get_tenant_settings(self.db, tenant_id)
+            if settings is not None:
+                return settings
         
         return {
             "company_name": "Firma Adı Belirtilmemiş",
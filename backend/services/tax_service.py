@@ -15,9 +15,14 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import extract, or_
-import json
+import copy
 
 from .. import models, schemas
+from .. import json_utils
+from .cache_service import TTLCache
+
+# Yıl bazlı vergi parametreleri nadiren değişir; süreç içinde önbelleğe al
+TAX_PARAMS_CACHE = TTLCache(ttl_seconds=300)
 
 
 class TaxService:
@@ -25,22 +30,25 @@ class TaxService:
     
     def __init__(self, db: Session):
         self.db = db
-        self._tax_params: Optional[Dict[str, Any]] = None
     
     def get_tax_parameters(self, year: int = 2026) -> Dict[str, Any]:
-        """Vergi parametrelerini SystemSettings'den al"""
-        if self._tax_params is not None:
-            return self._tax_params
-        
-        setting = self.db.query(models.SystemSetting).filter(
-            models.SystemSetting.key == f"tax_parameters_{year}"
-        ).first()
-        
-        if setting and setting.value:
-            self._tax_params = json.loads(setting.value)
-            return self._tax_params
+        """Vergi parametrelerini SystemSettings'den al (çağıran değiştirebilsin diye kopya döner)"""
+        params = TAX_PARAMS_CACHE.get(year)
+        if params is None:
+            setting = self.db.query(models.SystemSetting).filter(
+                models.SystemSetting.key == f"tax_parameters_{year}"
+            ).first()
+            
+            if setting and setting.value:
+                params = json_utils.loads(setting.value)
+            else:
+                params = self._default_tax_parameters(year)
+            TAX_PARAMS_CACHE.set(year, params)
         
-        # Varsayılan değerler
+        return copy.deepcopy(params)
+    
+    def _default_tax_parameters(self, year: int) -> Dict[str, Any]:
+        """Varsayılan değerler"""
         return {
             "year": year,
             "venture_capital_limit": 5000000.0,
@@ -485,11 +493,11 @@ class TaxService:
         ).first()
         
         if setting:
-            setting.value = json.dumps(current_params)
+            setting.value = json_utils.dumps(current_params)
         else:
             setting = models.SystemSetting(
                 key=key,
-                value=json.dumps(current_params),
+                value=json_utils.dumps(current_params),
                 description=f"{year} Yılı Teknokent Vergi Parametreleri"
             )
             self.db.add(setting)
@@ -497,7 +505,7 @@ class TaxService:
         self.db.commit()
         
         # Cache'i temizle
-        self._tax_params = None
+        TAX_PARAMS_CACHE.invalidate(year)
         
         # Pydantic modeline dönüştür
         return schemas.TaxParameters2026(**current_params)
@@ -9,6 +9,13 @@ from .tax_service import TaxService
 from .payroll_service import PayrollService
 from .reporting_service import ReportingService
 from .legal_basis_service import LegalBasisService
+from .tenant_settings_service import get_tenant_settings
+from .cache_service import TTLCache
+
+# Otomatik doldurma birçok tabloyu toplar; aynı dönem için kısa süreli tutulur.
+# Kaynak verileri (rapor, fatura, proje, personel/bordro, firma ayarları, vergi
+# parametreleri) yazan endpoint'ler önbelleği temizler
+AUTOFILL_CACHE = TTLCache(ttl_seconds=60)
 
 
 class TechnoparkReportService:
@@ -770,14 +777,7 @@ class TechnoparkReportService:
     def _get_company_info(self, tenant_id: Optional[int]) -> Dict[str, Any]:
         if not tenant_id:
             return {}
-        tenant = self.db.query(models.Tenant).filter(models.Tenant.id == tenant_id).first()
-        if tenant and tenant.settings:
-            try:
-                import json
-                return json.loads(tenant.settings)
-            except Exception:
-                return {}
-        return {}
+        return get_tenant_settings(self.db, tenant_id) or {}
 
     def _build_period_label(self, year: int, month: int) -> str:
         month_names = [
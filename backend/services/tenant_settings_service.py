@@ -0,0 +1,44 @@
+"""
+Tenant ayarları (Tenant.settings JSON metni)
+
+Firma bilgileri tenant satırında JSON metni olarak saklanır. Ayrıştırma
+içerik anahtarlı önbellekten geçer: aynı metin bir kez çözülür, ayarlar
+güncellendiğinde metin değiştiği için eski kayıt hiç okunmaz.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from .. import json_utils
+
+
+@lru_cache(maxsize=256)
+def _parse_settings_json(settings_json: str) -> Dict[str, Any]:
+    return json_utils.loads(settings_json)
+
+
+def parse_tenant_settings(settings_json: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Ayar metninin özel bir kopyasını döndür (boş ya da geçersizse None)"""
+    if not settings_json:
+        return None
+    try:
+        return dict(_parse_settings_json(settings_json))
+    except json_utils.JSONDecodeError:
+        return None
+
+
+def load_tenant_settings(tenant: models.Tenant) -> Dict[str, Any]:
+    """Yüklenmiş tenant'ın ayarları ({} boş ya da geçersizse)"""
+    settings = parse_tenant_settings(tenant.settings)
+    return settings if settings is not None else {}
+
+
+def get_tenant_settings(db: Session, tenant_id: int) -> Optional[Dict[str, Any]]:
+    """Sadece settings kolonunu okuyarak tenant ayarlarını getir"""
+    settings_json = db.query(models.Tenant.settings).filter(
+        models.Tenant.id == tenant_id
+    ).scalar()
+    return parse_tenant_settings(settings_json)
@@ -0,0 +1,21 @@
+"""
+Akış (streaming) yardımcıları
+
+Bellekteki dosya benzeri nesneleri (PDF, ZIP) StreamingResponse'a sabit
+boyutlu parçalar halinde vermek için.
+"""
+
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_file_chunks(file_obj, chunk_size: int = PDF_STREAM_CHUNK_SIZE):
+    """Yield a file-like object's content in fixed-size chunks, closing it afterwards"""
+    try:
+        file_obj.seek(0)
+        while True:
+            chunk = file_obj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file_obj.close()
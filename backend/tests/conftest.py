@@ -1,12 +1,12 @@
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import raiseload, sessionmaker
 from fastapi.testclient import TestClient
 from typing import Generator
 
 from backend.main import app
 from backend.database import get_db, Base
-from backend.models import User, UserRole
+from backend.models import TechnoparkReport, Tenant, User, UserRole
 from backend.routers.auth import create_access_token
 
 # Use in-memory SQLite for tests
@@ -16,11 +16,19 @@ engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 from sqlalchemy import event
+# Same connection setup as backend/database.py's SQLite engine
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
+    # Let SQLAlchemy emit BEGIN itself; pysqlite's implicit transactions would
+    # otherwise turn RELEASE SAVEPOINT into a real commit
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def do_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -36,7 +44,9 @@ def db_engine():
 def db(db_engine):
     connection = db_engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Commits and rollbacks inside the app only touch a savepoint; the outer
+    # transaction (and the fixture data) lives until the test ends
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
@@ -44,6 +54,47 @@ def db(db_engine):
     transaction.rollback()
     connection.close()
 
+# Entities whose response paths are expected to eager-load everything they serialize
+STRICT_LOADING_ENTITIES = (User, Tenant, TechnoparkReport)
+
+@pytest.fixture(scope="function")
+def strict_loading(db):
+    """Make any lazy load on User, Tenant or TechnoparkReport queries raise.
+
+    Keeps the eager-loading fixes from silently regressing into N+1 queries.
+    populate_existing re-applies the loader options to objects the fixtures
+    already put in the identity map.
+    """
+    def apply_raiseload(orm_execute_state):
+        if (
+            not orm_execute_state.is_select
+            or orm_execute_state.is_column_load
+            or orm_execute_state.is_relationship_load
+        ):
+            return
+        selected = [d.get("type") for d in orm_execute_state.statement.column_descriptions]
+        if any(entity in STRICT_LOADING_ENTITIES for entity in selected):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*")
+            ).execution_options(populate_existing=True)
+
+    event.listen(db, "do_orm_execute", apply_raiseload)
+    yield db
+    event.remove(db, "do_orm_execute", apply_raiseload)
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    # Process-level caches outlive each test's rolled-back transaction
+    from backend.services.tax_service import TAX_PARAMS_CACHE
+    from backend.routers.settings import TAX_SUMMARY_CACHE
+    from backend.services.technopark_report_service import AUTOFILL_CACHE
+    from backend.services.invoice_parser import PAGE_CACHE
+    TAX_PARAMS_CACHE.invalidate()
+    TAX_SUMMARY_CACHE.invalidate()
+    AUTOFILL_CACHE.invalidate()
+    PAGE_CACHE.invalidate()
+    yield
+
 @pytest.fixture(scope="function")
 def client(db):
     def override_get_db():
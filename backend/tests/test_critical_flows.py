@@ -36,6 +36,12 @@ def test_register_and_login(client: TestClient, db):
     assert response.status_code == 200
     assert response.json()["email"] == user_data["email"]
 
+    # 4. Duplicate registration is rejected; the existing user is untouched
+    response = client.post("/auth/register", json=user_data)
+    assert response.status_code == 400
+    response = client.get("/auth/me", headers=headers)
+    assert response.status_code == 200
+
 def test_create_and_list_accounts(client: TestClient, token_headers):
     # 1. Create Account (Customer)
     account_data = {
@@ -66,6 +72,50 @@ def test_create_and_list_accounts(client: TestClient, token_headers):
         assert len(response.json()) >= 1
         assert any(a["id"] == account_id for a in response.json())
 
+def test_create_and_list_products(client: TestClient, token_headers):
+    product_data = {
+        "name": "Danışmanlık",
+        "code": "SRV-1",
+        "unit_price": 1250.5,
+        "vat_rate": 20,
+        "unit": "Saat",
+    }
+    response = client.post("/products/", json=product_data, headers=token_headers)
+    assert response.status_code == 200, response.text
+    created = response.json()
+
+    response = client.get("/products/", headers=token_headers)
+    assert response.status_code == 200
+    listed = response.json()
+    assert listed == [created]
+    assert schemas.Product.model_validate(listed[0]).product_type == schemas.ProductType.SERVICE
+
+def test_list_transactions(client: TestClient, db, tenant):
+    from datetime import datetime
+    from backend import models
+    older = models.Transaction(
+        tenant_id=tenant.id,
+        transaction_type="Collection",
+        credit=500.0,
+        date=datetime(2024, 1, 5, 10, 30),
+        description="Tahsilat",
+    )
+    newer = models.Transaction(
+        tenant_id=tenant.id,
+        transaction_type="Payment",
+        debit=120.25,
+        date=datetime(2024, 2, 1, 9, 0),
+    )
+    db.add_all([older, newer])
+    db.commit()
+
+    response = client.get("/finance/transactions")
+    assert response.status_code == 200
+    listed = response.json()
+    assert [t["id"] for t in listed] == [newer.id, older.id]
+    # Same payload the response_model would have produced
+    assert listed[1] == schemas.Transaction.model_validate(older).model_dump(mode="json")
+
 def test_create_and_list_projects(client: TestClient, token_headers):
     # 1. Create Project
     project_data = {
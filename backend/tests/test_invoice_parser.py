@@ -0,0 +1,158 @@
+import io
+
+from reportlab.pdfgen import canvas
+
+from backend.services import invoice_parser
+from backend.services.invoice_parser import (
+    _classify_table,
+    _extract_customer_info,
+    _extract_issuer_info,
+    _extract_totals_from_text,
+    _parse_line_items_table,
+    _parse_turkish_currency,
+)
+
+INVOICE_TEXT = """ACME YAZILIM LTD. ŞTİ.
+Atatürk Mah. 123 Sok. No:5 Çankaya ANKARA
+Vergi Dairesi: Çankaya
+VKN: 1234567890
+e-Fatura
+SAYIN
+PIKOLAB BİLİŞİM TEKNOLOJİLERİ LTD. ŞTİ.
+Üniversiteler Mah. ODTÜ Teknokent Binası No:12 ANKARA
+Vergi Dairesi: Bilkent
+VKN: 9876543210
+Sıra No Stok Kodu Ürün / Hizmet Cinsi Miktar
+Mal Hizmet Toplam Tutarı 12.500,00 TL
+Toplam İskonto 500,00 TL
+KDV'siz Net Tutar 12.000,00 TL
+Hesaplanan KDV(%20) 2.400,00 TL
+KDV Dahil Toplam Tutar 14.400,00 TL
+Ödenecek Tutar 14.400,00 TL
+"""
+
+
+def test_extract_parties():
+    issuer = _extract_issuer_info(INVOICE_TEXT)
+    assert issuer["issuer_name"] == "ACME YAZILIM LTD. ŞTİ."
+    assert issuer["issuer_tax_id"] == "1234567890"
+    assert issuer["issuer_tax_office"] == "Çankaya"
+
+    customer = _extract_customer_info(INVOICE_TEXT)
+    assert customer["customer_name"] == "PIKOLAB BİLİŞİM TEKNOLOJİLERİ LTD. ŞTİ."
+    assert customer["customer_tax_id"] == "9876543210"
+    assert customer["customer_tax_office"] == "Bilkent"
+
+
+def test_issuer_info_only_reads_header_lines():
+    # Address lines past the 30-line header window are ignored
+    text = "ACME LTD. ŞTİ.\n" + "\n".join(f"Satır {i} Mah." for i in range(1, 40))
+    issuer = _extract_issuer_info(text)
+    assert issuer["issuer_name"] == "ACME LTD. ŞTİ."
+    assert issuer["issuer_address"].endswith("Satır 29 Mah.")
+
+
+def test_extract_totals_from_text():
+    assert _extract_totals_from_text(INVOICE_TEXT) == {
+        "gross_total": 12500.0,
+        "total_discount": 500.0,
+        "net_subtotal": 12000.0,
+        "vat_amount": 2400.0,
+        "grand_total": 14400.0,
+        "payable": 14400.0,
+    }
+    assert _extract_totals_from_text("") == dict.fromkeys(
+        ["gross_total", "total_discount", "net_subtotal", "vat_amount", "grand_total", "payable"]
+    )
+
+
+def test_parse_line_items_table():
+    table = [
+        ["Sıra\nNo", "Ürün / Hizmet\nCinsi", "Miktar", "Birim Fiyat", "İskonto\nOranı",
+         "İskonto\nTutarı", "KDV\nOranı", "Mal Hizmet\nTutarı"],
+        ["1", "Danışmanlık", "42,00\nAdet", "1.250,50 TL", "%10,00", "5.252,10TL", "%20,00", "47.268,90 TL"],
+        ["", "", "", "", "", "", "", ""],
+        ["2", "", "1", "", "", "", "", ""],
+    ]
+    assert _parse_line_items_table(table) == [{
+        "description": "Danışmanlık",
+        "quantity": 42.0,
+        "unit_price": 1250.5,
+        "total": 47268.9,
+        "discount_rate": 10,
+        "discount_amount": 5252.1,
+        "vat_rate": 20,
+    }]
+
+
+def test_classify_table():
+    assert _classify_table([["Sıra No", "Ürün / Hizmet Cinsi", "Miktar"], ["1", "Kira", "1"]]) == "line_items"
+    assert _classify_table([["Özelleştirme No", "TR1.2"], ["Fatura No", "ABC123"]]) == "metadata"
+    assert _classify_table([["Mal Hizmet Toplam Tutarı", "100,00 TL"], ["Ödenecek Tutar", "120,00 TL"]]) == "totals"
+    assert _classify_table([["Teslimat adresi farklıdır"], ["Ödeme 30 gün içinde"]]) == "notes"
+    assert _classify_table([["a", "1"], ["b", "2"]]) == "unknown"
+
+
+def test_parse_turkish_currency():
+    assert _parse_turkish_currency("1.234,56TL") == 1234.56
+    assert _parse_turkish_currency(" 12 tl ") == 12.0
+    assert _parse_turkish_currency("TL") is None
+    assert _parse_turkish_currency("abc") is None
+    assert _parse_turkish_currency(None) is None
+
+
+def _make_pdf(lines):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    y = 800
+    for line in lines:
+        pdf.drawString(40, y, line)
+        y -= 14
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_parse_uploaded_invoice(client):
+    content = _make_pdf([
+        "ACME YAZILIM LTD. STI.",
+        "VKN: 1234567890",
+        "SAYIN",
+        "PIKOLAB BILISIM LTD. STI.",
+        "VKN: 9876543210",
+        "Fatura Tarihi: 15.03.2024",
+        "KDV'siz Net Tutar 12.000,00 TL",
+        "Hesaplanan KDV(%20) 2.400,00 TL",
+        "Odenecek Tutar 14.400,00 TL",
+    ])
+    response = client.post(
+        "/finance/invoices/parse",
+        files={"file": ("fatura.pdf", content, "application/pdf")},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["issue_date"] == "2024-03-15"
+    assert data["net_subtotal"] == 12000.0
+    assert data["tax_amount"] == 2400.0
+    assert data["issuer_tax_id"] == "1234567890"
+
+
+def test_parse_uploaded_invoice_reuses_extracted_pages(client, monkeypatch):
+    calls = []
+    extract_pages = invoice_parser._extract_pages
+
+    def counting_extract_pages(stream):
+        calls.append(stream)
+        return extract_pages(stream)
+
+    monkeypatch.setattr(invoice_parser, "_extract_pages", counting_extract_pages)
+    content = _make_pdf(["KDV'siz Net Tutar 12.000,00 TL"])
+    files = {"file": ("fatura.pdf", content, "application/pdf")}
+
+    first = client.post("/finance/invoices/parse", files=files)
+    second = client.post("/finance/invoices/parse?invoice_type=Sales", files=files)
+    assert first.status_code == second.status_code == 200
+    assert first.json()["net_subtotal"] == second.json()["net_subtotal"] == 12000.0
+    assert len(calls) == 1
+
+    client.post("/finance/invoices/parse", files={"file": ("fatura.pdf", _make_pdf(["Baska"]), "application/pdf")})
+    assert len(calls) == 2
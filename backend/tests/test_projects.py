@@ -34,3 +34,18 @@ def test_project_routing_slash(client, token_headers):
     # If 405 was happening, it means Method Not Allowed on target.
     response = client.post("/projects", json=data, headers=token_headers)
     assert response.status_code == 200
+
+def test_project_summary(client, token_headers):
+    data = {"name": "Summary Project", "code": "PROJ-SUM", "status": "Active"}
+    project = client.post("/projects", json=data, headers=token_headers).json()
+
+    response = client.get(f"/projects/{project['id']}/summary", headers=token_headers)
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["project"]["code"] == "PROJ-SUM"
+    assert summary["project"]["status"] == "Active"
+    assert summary["profit"] == 0
+    assert summary["invoice_count"] == 0
+
+    response = client.get("/projects/99999/summary", headers=token_headers)
+    assert response.status_code == 404
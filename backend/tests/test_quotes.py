@@ -0,0 +1,173 @@
+import asyncio
+import io
+import os
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from backend import models
+from backend.routers import sales
+from backend.routers.sales import split_quote_notes
+from backend.services.pdf_pool import run_in_pdf_pool, shutdown_pdf_pool, start_pdf_pool
+
+
+def _create_quote(client: TestClient, db, tenant, items):
+    account = models.Account(title="Quote Account", tenant_id=tenant.id)
+    db.add(account)
+    db.commit()
+    contact = models.Contact(first_name="Ali", last_name="Veli", account_id=account.id, tenant_id=tenant.id)
+    db.add(contact)
+    db.commit()
+
+    response = client.post("/sales/quotes", json={
+        "account_id": account.id,
+        "contact_id": contact.id,
+        "items": items,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_update_quote_diffs_items_by_id(client: TestClient, db, tenant):
+    quote = _create_quote(client, db, tenant, [
+        {"description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20},
+        {"description": "Yazılım", "quantity": 2, "unit_price": 50, "vat_rate": 20},
+        {"description": "Eğitim", "quantity": 1, "unit_price": 10, "vat_rate": 20},
+    ])
+    kept, edited, _ = quote["items"]
+
+    response = client.put(f"/sales/quotes/{quote['id']}", json={"items": [
+        {"id": kept["id"], "description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20},
+        {"id": edited["id"], "description": "Yazılım", "quantity": 3, "unit_price": 50, "vat_rate": 20},
+        {"description": "Destek", "quantity": 1, "unit_price": 25, "vat_rate": 0},
+    ]})
+    assert response.status_code == 200, response.text
+    data = response.json()
+
+    items = {item["description"]: item for item in data["items"]}
+    assert set(items) == {"Danışmanlık", "Yazılım", "Destek"}
+    assert items["Danışmanlık"]["id"] == kept["id"]
+    assert items["Yazılım"]["id"] == edited["id"]
+    assert items["Yazılım"]["quantity"] == 3
+    assert items["Yazılım"]["line_total"] == 150
+    assert data["subtotal"] == 275
+    assert data["total_amount"] == 275 + 50
+
+
+def test_update_quote_without_ids_replaces_items(client: TestClient, db, tenant):
+    quote = _create_quote(client, db, tenant, [
+        {"description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20},
+    ])
+
+    response = client.put(f"/sales/quotes/{quote['id']}", json={"items": [
+        {"description": "Yazılım", "quantity": 2, "unit_price": 50, "vat_rate": 0},
+    ]})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [item["description"] for item in data["items"]] == ["Yazılım"]
+    assert data["total_amount"] == 100
+
+
+def test_bulk_quote_pdf_returns_zip(client: TestClient, db, tenant):
+    item = {"description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20}
+    first = _create_quote(client, db, tenant, [item])
+    second = _create_quote(client, db, tenant, [item])
+
+    response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": [first["id"], second["id"]]})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        names = archive.namelist()
+        assert names == [f"Teklif_{first['quote_no']}.pdf", f"Teklif_{second['quote_no']}.pdf"]
+        assert all(archive.read(name).startswith(b"%PDF") for name in names)
+
+    # Duplicate ids are exported once
+    response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": [first["id"], first["id"]]})
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == [f"Teklif_{first['quote_no']}.pdf"]
+
+    response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": [first["id"], 99999]})
+    assert response.status_code == 404
+
+    response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": []})
+    assert response.status_code == 422
+
+    response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": [first["id"]] * 51})
+    assert response.status_code == 422
+
+
+def test_bulk_quote_pdf_loads_projects_in_one_query(client: TestClient, db, tenant):
+    item = {"description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20}
+    quotes = [_create_quote(client, db, tenant, [item]) for _ in range(3)]
+    for number, quote in enumerate(quotes):
+        project = models.Project(name="Ar-Ge", code=f"PRJ-PDF-{number}", tenant_id=tenant.id, is_technopark_project=True)
+        db.add(project)
+        db.flush()
+        db.query(models.Quote).filter(models.Quote.id == quote["id"]).update({models.Quote.project_id: project.id})
+    db.commit()
+    # Start from an empty identity map so every relationship has to be loaded
+    db.expunge_all()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post("/sales/quotes/bulk-pdf", json={"quote_ids": [quote["id"] for quote in quotes]})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    assert sum("FROM projects" in statement for statement in statements) == 1
+
+
+def test_pdf_pool_replaces_broken_pool():
+    async def render_after_crash():
+        # The job that killed its worker fails (it is not retried); the next one
+        # runs on a fresh pool
+        broken = start_pdf_pool()
+        with pytest.raises(BrokenProcessPool):
+            await run_in_pdf_pool(os._exit, 1)
+        assert start_pdf_pool() is not broken
+        return await run_in_pdf_pool(pow, 2, 3)
+
+    try:
+        assert asyncio.run(render_after_crash()) == 8
+    finally:
+        shutdown_pdf_pool()
+
+
+def test_quote_pdf_returns_500_when_render_crashes(client: TestClient, db, tenant, monkeypatch):
+    quote = _create_quote(client, db, tenant, [
+        {"description": "Danışmanlık", "quantity": 1, "unit_price": 100, "vat_rate": 20},
+    ])
+
+    async def broken_pool(func, *args):
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(sales, "run_in_pdf_pool", broken_pool)
+    response = client.get(f"/sales/quotes/{quote['id']}/pdf")
+    assert response.status_code == 500
+
+
+def test_split_quote_notes_matches_previous_precedence():
+    # Expected lists are the output of the original if/elif splitting
+    mixed = "Ödeme ve Teslim Koşulları:\nTeslim: 4-6 hafta - stoktan\nÖdeme: %50 peşin - %50 teslimde\n\nGaranti 2 yıl"
+    assert split_quote_notes(mixed) == [
+        "Teslim: 4-6 hafta - stoktan", "Ödeme: %50 peşin - %50 teslimde", "Garanti 2 yıl"
+    ]
+    assert split_quote_notes("- Madde bir\n- Madde iki") == ["- Madde bir", "- Madde iki"]
+    assert split_quote_notes("Teslim 4-6 hafta - Ödeme peşin - KDV hariç") == [
+        "Teslim 4-6 hafta", "Ödeme peşin", "KDV hariç"
+    ]
+    assert split_quote_notes("Ödeme ve Teslim Koşulları - Teslim 2 hafta - Kurulum dahil") == [
+        "Teslim 2 hafta", "Kurulum dahil"
+    ]
+    assert split_quote_notes("Peşin-Havale-EFT") == ["Peşin", "Havale", "EFT"]
+    assert split_quote_notes("Fiyatlar 30 gün geçerlidir") == ["Fiyatlar 30 gün geçerlidir"]
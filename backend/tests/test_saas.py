@@ -1,6 +1,10 @@
 from fastapi.testclient import TestClient
 from backend import models, schemas
+from backend.database import is_unique_violation
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from backend.routers.auth import create_access_token
 
 def test_create_tenant(client: TestClient, admin_token_headers):
     response = client.post(
@@ -14,6 +18,131 @@ def test_create_tenant(client: TestClient, admin_token_headers):
     assert data["slug"] == "new-tenant"
     assert data["id"] is not None
 
+def test_create_tenant_duplicate_slug(client: TestClient, admin_token_headers, tenant):
+    response = client.post(
+        "/tenants",
+        headers=admin_token_headers,
+        json={"name": "Copy", "slug": tenant.slug}
+    )
+    assert response.status_code == 400
+
+    # Only the failed INSERT is rolled back; the rest of the session is intact
+    response = client.get(f"/tenants/{tenant.id}", headers=admin_token_headers)
+    assert response.status_code == 200
+    assert response.json()["slug"] == tenant.slug
+
+def test_is_unique_violation(db: Session, test_user):
+    def violation(**values):
+        try:
+            with db.begin_nested():
+                db.execute(insert(models.User).values(hashed_password="x", **values))
+        except IntegrityError as e:
+            return e
+        raise AssertionError("INSERT did not fail")
+
+    duplicate = violation(email=test_user.email, tenant_id=test_user.tenant_id)
+    assert is_unique_violation(duplicate, "users", "email")
+    missing_tenant = violation(email="fk@example.com", tenant_id=99999)
+    assert not is_unique_violation(missing_tenant, "users", "email")
+
+def test_create_tenant_admin(client: TestClient, admin_token_headers, tenant):
+    payload = {"email": "owner@example.com", "full_name": "Owner", "password": "secret123"}
+    response = client.post(f"/tenants/{tenant.id}/admin", headers=admin_token_headers, json=payload)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["role"] == "admin"
+    assert data["is_active"] is True
+    assert data["created_at"] is not None
+
+    response = client.post("/tenants/99999/admin", headers=admin_token_headers, json=payload)
+    assert response.status_code == 404
+
+    response = client.post(f"/tenants/{tenant.id}/admin", headers=admin_token_headers, json=payload)
+    assert response.status_code == 400
+
+def test_list_and_read_tenants(client: TestClient, admin_token_headers, tenant, strict_loading):
+    response = client.get("/tenants", headers=admin_token_headers)
+    assert response.status_code == 200
+    listed = {t["id"]: t for t in response.json()}
+    assert listed[tenant.id]["slug"] == tenant.slug
+    assert listed[tenant.id]["created_at"] is not None
+
+    response = client.get(f"/tenants/{tenant.id}", headers=admin_token_headers)
+    assert response.status_code == 200
+    assert response.json()["name"] == tenant.name
+
+    response = client.get("/tenants/99999", headers=admin_token_headers)
+    assert response.status_code == 404
+
+def test_update_tenant(client: TestClient, admin_token_headers, tenant):
+    response = client.put(f"/tenants/{tenant.id}", headers=admin_token_headers, json={"name": "Renamed"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.json()["slug"] == tenant.slug
+
+    response = client.put(f"/tenants/{tenant.id}", headers=admin_token_headers, json={})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+
+    response = client.put("/tenants/99999", headers=admin_token_headers, json={"name": "X"})
+    assert response.status_code == 404
+
+def test_list_users(client: TestClient, admin_token_headers, test_user, strict_loading):
+    response = client.get("/users", headers=admin_token_headers)
+    assert response.status_code == 200
+    users = {u["email"]: u for u in response.json()}
+    assert users[test_user.email]["role"] == "user"
+    assert users[test_user.email]["full_name"] == "Test User"
+    assert "hashed_password" not in users[test_user.email]
+
+def test_create_user_duplicate_email(client: TestClient, admin_token_headers, test_user):
+    payload = {"email": "new@example.com", "full_name": "New", "password": "pw", "role": "admin"}
+    response = client.post("/users", json=payload, headers=admin_token_headers)
+    assert response.status_code == 200
+    assert response.json()["role"] == "admin"
+    assert response.json()["is_active"] is True
+
+    payload["email"] = test_user.email
+    response = client.post("/users", json=payload, headers=admin_token_headers)
+    assert response.status_code == 400
+
+    # Users created earlier in the session survive the failed INSERT
+    response = client.get("/users", headers=admin_token_headers)
+    assert {"new@example.com", test_user.email} <= {u["email"] for u in response.json()}
+
+def test_update_user_is_tenant_scoped(client: TestClient, db: Session, test_user):
+    other_tenant = models.Tenant(name="Other", slug="other", is_active=True)
+    db.add(other_tenant)
+    db.commit()
+    tenant_admin = models.User(
+        email="tenantadmin@example.com",
+        hashed_password="hashedpassword",
+        full_name="Tenant Admin",
+        role=models.UserRole.ADMIN,
+        is_active=True,
+        tenant_id=test_user.tenant_id,
+    )
+    outsider = models.User(
+        email="outsider@example.com",
+        hashed_password="hashedpassword",
+        full_name="Outsider",
+        is_active=True,
+        tenant_id=other_tenant.id,
+    )
+    db.add_all([tenant_admin, outsider])
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(tenant_admin.email)}"}
+
+    response = client.put(f"/users/{test_user.id}", headers=headers, json={"full_name": "Renamed"})
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed"
+
+    response = client.put(f"/users/{outsider.id}", headers=headers, json={"full_name": "Nope"})
+    assert response.status_code == 403
+
+    response = client.put("/users/99999", headers=headers, json={"full_name": "Nope"})
+    assert response.status_code == 404
+
 def test_contact_quotes(client: TestClient, token_headers, db: Session, test_user):
     # Setup data
     # Create Account
@@ -144,3 +273,38 @@ def test_quote_fails_without_contact(client: TestClient, token_headers, db: Sess
     )
     # Validate Validation Error (422)
     assert response.status_code == 422
+
+def test_quote_revisions_are_flat(client: TestClient, token_headers, db: Session, test_user):
+    account = models.Account(title="Revision Account", tenant_id=test_user.tenant_id)
+    db.add(account)
+    db.flush()
+    contact = models.Contact(first_name="Rev", last_name="Ision", account_id=account.id, tenant_id=test_user.tenant_id)
+    db.add(contact)
+    db.flush()
+
+    def make_quote(quote_no, parent=None, revision_number=0):
+        quote = models.Quote(
+            quote_no=quote_no,
+            account_id=account.id,
+            contact_id=contact.id,
+            tenant_id=test_user.tenant_id,
+            parent_quote_id=parent.id if parent else None,
+            revision_number=revision_number,
+        )
+        db.add(quote)
+        db.flush()
+        return quote
+
+    # Revisions always hang off the root quote
+    root = make_quote("TEST-Q-100")
+    first = make_quote("TEST-Q-100-R1", root, 1)
+    second = make_quote("TEST-Q-100-R2", root, 2)
+    db.commit()
+
+    response = client.get("/sales/quotes/grouped", headers=token_headers)
+    assert response.status_code == 200
+    listed = next(q for q in response.json() if q["id"] == root.id)
+    assert [r["quote_no"] for r in sorted(listed["revisions"], key=lambda r: r["revision_number"])] == [
+        first.quote_no, second.quote_no
+    ]
+    assert all("revisions" not in r for r in listed["revisions"])
@@ -0,0 +1,91 @@
+from fastapi.testclient import TestClient
+
+
+def test_company_settings_roundtrip(client: TestClient, token_headers):
+    response = client.get("/settings/company", headers=token_headers)
+    assert response.status_code == 200
+    assert response.json()["invoice_prefix"] == "FAT"
+
+    response = client.post(
+        "/settings/company",
+        json={"company_name": "Pikolab", "quote_prefix": "PA"},
+        headers=token_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["company_name"] == "Pikolab"
+
+    # Partial update keeps previously stored keys
+    response = client.post(
+        "/settings/company",
+        json={"tax_id": "1234567890"},
+        headers=token_headers,
+    )
+    assert response.status_code == 200
+
+    data = client.get("/settings/company", headers=token_headers).json()
+    assert data["company_name"] == "Pikolab"
+    assert data["quote_prefix"] == "PA"
+    assert data["tax_id"] == "1234567890"
+
+
+def test_company_settings_invalid_json(client: TestClient, token_headers, tenant, db):
+    tenant.settings = "{not json"
+    db.commit()
+
+    response = client.get("/settings/company", headers=token_headers)
+    assert response.status_code == 200
+    assert response.json()["company_name"] is None
+
+
+def test_company_settings_coerces_stored_values(client: TestClient, token_headers, tenant, db):
+    # The blob can also be written raw through tenant management
+    tenant.settings = '{"invoice_next_number": "7"}'
+    db.commit()
+
+    response = client.get("/settings/company", headers=token_headers)
+    assert response.status_code == 200
+    assert response.json()["invoice_next_number"] == 7
+
+
+
+def test_report_company_info_reads_tenant_settings(db, tenant):
+    from backend.services.reporting_service import ReportingService
+    from backend.services.technopark_report_service import TechnoparkReportService
+
+    tenant.settings = '{"company_name": "Pikolab", "tax_id": "1234567890"}'
+    db.commit()
+    assert ReportingService(db)._get_company_info(tenant.id)["company_name"] == "Pikolab"
+    assert TechnoparkReportService(db)._get_company_info(tenant.id)["tax_id"] == "1234567890"
+
+    tenant.settings = "{not json"
+    db.commit()
+    assert ReportingService(db)._get_company_info(tenant.id)["company_name"] == "Firma Adı Belirtilmemiş"
+    assert TechnoparkReportService(db)._get_company_info(tenant.id) == {}
+
+def test_tax_parameters_cache_invalidated_on_update(client: TestClient, admin_token_headers):
+    response = client.get("/settings/tax-parameters?year=2026", headers=admin_token_headers)
+    assert response.status_code == 200
+    assert response.json()["vat_rate"] == 0.20
+
+    response = client.patch(
+        "/settings/tax-parameters?year=2026",
+        json={"vat_rate": 0.10},
+        headers=admin_token_headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/settings/tax-parameters?year=2026", headers=admin_token_headers)
+    assert response.json()["vat_rate"] == 0.10
+    # Other years keep their own cached entry
+    response = client.get("/settings/tax-parameters?year=2027", headers=admin_token_headers)
+    assert response.json()["vat_rate"] == 0.20
+
+
+def test_tax_parameters_rejects_out_of_range_rates(client: TestClient, admin_token_headers):
+    response = client.patch(
+        "/settings/tax-parameters?year=2026",
+        json={"vat_rate": 0.2, "sgk_employer_share_discount": 1.5},
+        headers=admin_token_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "SGK işveren hissesi indirimi 0-1 arasında olmalıdır"
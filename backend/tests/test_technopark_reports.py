@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from backend import models
+
+
+def test_list_reports_loads_children_eagerly(client: TestClient, db: Session, token_headers, test_user, strict_loading):
+    report = models.TechnoparkReport(tenant_id=test_user.tenant_id, year=2026, month=1, period_label="Ocak 2026")
+    report.project_entries.append(models.TechnoparkProjectEntry(project_name="Proje A"))
+    db.add(report)
+    db.commit()
+
+    response = client.get("/technopark-reports/", params={"year": 2026}, headers=token_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert [entry["project_name"] for entry in data[0]["project_entries"]] == ["Proje A"]
+    assert data[0]["line_items"] == []
+
+
+def test_update_report_refreshes_cached_autofill(client: TestClient, db: Session, token_headers, test_user):
+    report = models.TechnoparkReport(tenant_id=test_user.tenant_id, year=2026, month=2, company_name="Eski A.Ş.")
+    db.add(report)
+    db.commit()
+
+    params = {"year": 2026, "month": 2}
+    response = client.get("/technopark-reports/auto-fill", params=params, headers=token_headers)
+    assert response.json()["company_name"] == "Eski A.Ş."
+
+    response = client.patch(f"/technopark-reports/{report.id}", json={"company_name": "Yeni A.Ş."}, headers=token_headers)
+    assert response.status_code == 200
+
+    response = client.get("/technopark-reports/auto-fill", params=params, headers=token_headers)
+    assert response.json()["company_name"] == "Yeni A.Ş."
+
+
+def test_company_settings_update_refreshes_cached_autofill(client: TestClient, token_headers):
+    client.post("/settings/company", json={"company_name": "Eski A.Ş."}, headers=token_headers)
+    params = {"year": 2026, "month": 3}
+    response = client.get("/technopark-reports/auto-fill", params=params, headers=token_headers)
+    assert response.json()["company_name"] == "Eski A.Ş."
+
+    client.post("/settings/company", json={"company_name": "Yeni A.Ş."}, headers=token_headers)
+
+    response = client.get("/technopark-reports/auto-fill", params=params, headers=token_headers)
+    assert response.json()["company_name"] == "Yeni A.Ş."
@@ -11,6 +11,7 @@ import { Trash2, Plus, Save } from 'lucide-react';
 import { Textarea } from '@/components/ui/textarea';
 
 interface QuoteItem {
+    id?: number;
     product_id: number | null;
     description: string;
     quantity: number;
@@ -105,9 +106,11 @@ const QuoteBuilder = () => {
             setValidUntil(existingQuote.valid_until ? existingQuote.valid_until.split('T')[0] : '');
             setNotes(existingQuote.notes || '');
             setItems(existingQuote.items?.map((item: any) => ({
+                id: item.id,
                 product_id: item.product_id,
                 description: item.description,
                 quantity: item.quantity,
+                unit: item.unit,
                 unit_price: item.unit_price,
                 discount_percent: item.discount_percent,
                 vat_rate: item.vat_rate,
@@ -201,6 +204,7 @@ const QuoteBuilder = () => {
             valid_until: validUntil || null,
             notes: notes || null,
             items: items.map(item => ({
+                id: item.id,
                 product_id: item.product_id,
                 description: item.description,
                 quantity: item.quantity,